@@ -83,11 +83,17 @@ setup(
             "plotly>=5.0.0",
             "matplotlib>=3.5.0",
         ],
+        "json": [
+            "orjson>=3.9.0",
+            "msgpack>=1.0.0",
+        ],
         "full": [
             "weasyprint>=60.0",
             "reportlab>=4.0.0",
             "plotly>=5.0.0",
             "matplotlib>=3.5.0",
+            "orjson>=3.9.0",
+            "msgpack>=1.0.0",
         ],
     },
     entry_points={
@@ -13,7 +13,7 @@ New Features in v3.0:
 
 # Core elements
 from .page import Page, Heading
-from .elements import Element, Paragraph, HtmlList, Image, Link, Div, Section, Card, Container
+from .elements import Element, escape_html, Paragraph, HtmlList, Image, Link, Div, Section, Card, Container
 from .css import CSSBuilder, Style
 
 # Enhanced forms
@@ -25,62 +25,76 @@ from .layout import Row, Column, Flex
 # Templates
 from .templates import Template, Slot, TemplateManager, create_hero_template, create_card_grid_template, create_footer_template
 
-# Advanced components
-from .components import (ComponentBase, HeroSection, FeatureCard, Navbar, Alert, Badge, 
-                        ProgressBar, Accordion, Modal)
-
-# Professional UI Components
-from .advanced_components import Table, Tabs, Carousel, Breadcrumb, Pagination, Toast, Rating, Avatar
-
-# Data Visualization
-from .data_visualization import Chart, BarChart, LineChart, PieChart, DoughnutChart, Dashboard, SparklineChart, KPICard
-
-# Advanced Forms
-from .forms_advanced import FileUpload, DateTimePicker, FormWizard, FormValidation, SearchableSelect
-
-# New Features - Animations
-from .animations import FadeIn, SlideUp, AnimateOnScroll, Pulse, Animation
-
-# New Features - Dark mode
-from .dark_mode import DarkModeToggle, ThemeProvider, create_auto_dark_mode
-
-# New Features - Debug tools
-from .debug_tools import enable_debug_view, disable_debug_view, get_debug_css, get_debug_js, DebugWrapper
-
-# New Features - Plugin system
-from .plugins import (
-    register_component, register_template, register_hook, register_filter,
-    plugin_registry, Timeline, StatCard, CodeBlock
-)
-
-# New Features - Export tools
-from .export_tools import (
-    to_dict, from_dict, to_json, from_json, to_pdf, check_pdf_support,
-    ExportManager, SerializableMixin
-)
+# Feature modules are imported on first attribute access (PEP 562), so
+# "from pypage import Page" does not pay for charts, exports and the other extras
+_LAZY_MODULES = {
+    # Advanced components
+    'components': ('ComponentBase', 'HeroSection', 'FeatureCard', 'Navbar', 'Alert', 'Badge',
+                   'ProgressBar', 'Accordion', 'Modal'),
+    
+    # Professional UI Components
+    'advanced_components': ('Table', 'Tabs', 'Carousel', 'CarouselItem', 'Breadcrumb', 'Pagination',
+                            'Toast', 'Rating', 'Avatar'),
+    
+    # Data Visualization
+    'data_visualization': ('Chart', 'BarChart', 'LineChart', 'PieChart', 'DoughnutChart', 'Dashboard',
+                           'SparklineChart', 'KPICard'),
+    
+    # Advanced Forms
+    'forms_advanced': ('FileUpload', 'DateTimePicker', 'FormWizard', 'WizardStep', 'FormValidation',
+                       'SearchableSelect'),
+    
+    # New Features - Animations
+    'animations': ('FadeIn', 'SlideUp', 'AnimateOnScroll', 'Pulse', 'Animation'),
+    
+    # New Features - Dark mode
+    'dark_mode': ('DarkModeToggle', 'ThemeProvider', 'create_auto_dark_mode'),
+    
+    # New Features - Debug tools
+    'debug_tools': ('enable_debug_view', 'disable_debug_view', 'get_debug_css', 'get_debug_js',
+                    'DebugWrapper'),
+    
+    # New Features - Plugin system
+    'plugins': ('register_component', 'register_template', 'register_hook', 'register_filter',
+                'plugin_registry', 'Timeline', 'TimelineEvent', 'StatCard', 'CodeBlock'),
+    
+    # New Features - Export tools
+    'export_tools': ('to_dict', 'from_dict', 'to_json', 'to_json_bytes', 'from_json', 'to_msgpack',
+                     'from_msgpack', 'to_pdf', 'to_pdf_batch', 'check_pdf_support', 'ExportManager',
+                     'SerializableMixin'),
+    
+    # Modern UI Components
+    'ui_components': ('InteractiveChart', 'DataVisualization', 'AdvancedFormBuilder',
+                      'MicroInteraction', 'AccessibilityChecker'),
+    
+    # Performance Tools
+    'performance_tools': ('HotReloadManager', 'PerformanceProfiler', 'SEOOptimizer', 'CodeSplitter'),
+    
+    # WebAssembly Integration
+    'webassembly_integration': ('WebAssemblyRenderer', 'ImageOptimizer', 'CriticalCSSExtractor'),
+}
 
-# Modern UI Components
-from .ui_components import (
-    InteractiveChart, DataVisualization, AdvancedFormBuilder, 
-    MicroInteraction, AccessibilityChecker
-)
+_LAZY_IMPORTS = {name: module for module, names in _LAZY_MODULES.items() for name in names}
 
-# Performance Tools
-from .performance_tools import (
-    HotReloadManager, PerformanceProfiler, SEOOptimizer, CodeSplitter
-)
+def __getattr__(name):
+    """Import a feature module the first time one of its names is used"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-# WebAssembly Integration
-from .webassembly_integration import (
-    WebAssemblyRenderer, ImageOptimizer, CriticalCSSExtractor
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __version__ = "3.0.0"
 
 __all__ = [
     # Core
     'Page', 'Heading', 'Element', 'Paragraph', 'HtmlList', 'Image', 'Link', 'Div', 'Section',
-    'Card', 'Container', 'CSSBuilder', 'Style',
+    'Card', 'Container', 'CSSBuilder', 'Style', 'escape_html',
     
     # Forms
     'Form', 'Input', 'Button', 'Select', 'TextArea',
@@ -97,14 +111,14 @@ __all__ = [
     'ProgressBar', 'Accordion', 'Modal',
     
     # Professional UI Components
-    'Table', 'Tabs', 'Carousel', 'Breadcrumb', 'Pagination', 'Toast', 'Rating', 'Avatar',
+    'Table', 'Tabs', 'Carousel', 'CarouselItem', 'Breadcrumb', 'Pagination', 'Toast', 'Rating', 'Avatar',
     
     # Data Visualization
     'Chart', 'BarChart', 'LineChart', 'PieChart', 'DoughnutChart', 'Dashboard', 
     'SparklineChart', 'KPICard',
     
     # Advanced Forms
-    'FileUpload', 'DateTimePicker', 'FormWizard', 'FormValidation', 'SearchableSelect',
+    'FileUpload', 'DateTimePicker', 'FormWizard', 'WizardStep', 'FormValidation', 'SearchableSelect',
     
     # Animations
     'FadeIn', 'SlideUp', 'AnimateOnScroll', 'Pulse', 'Animation',
@@ -117,10 +131,11 @@ __all__ = [
     
     # Plugin system
     'register_component', 'register_template', 'register_hook', 'register_filter',
-    'plugin_registry', 'Timeline', 'StatCard', 'CodeBlock',
+    'plugin_registry', 'Timeline', 'TimelineEvent', 'StatCard', 'CodeBlock',
     
     # Export tools
-    'to_dict', 'from_dict', 'to_json', 'from_json', 'to_pdf', 'check_pdf_support',
+    'to_dict', 'from_dict', 'to_json', 'to_json_bytes', 'from_json', 'to_msgpack', 'from_msgpack',
+    'to_pdf', 'to_pdf_batch', 'check_pdf_support',
     'ExportManager', 'SerializableMixin',
     
     # Modern UI Components
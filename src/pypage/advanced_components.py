@@ -1,9 +1,41 @@
 """
 Advanced UI components for professional web applications
 """
-from typing import Optional, List, Dict, Any, Union
+from itertools import zip_longest
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Union, NamedTuple
 from .elements import Element
-from .components import ComponentBase
+from .components import ComponentBase, _as_record
+
+class _Missing:
+    """Sentinel type that survives copying and pickling as the same object"""
+    
+    __slots__ = ()
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return '_MISSING'
+
+# Fills the gaps left by short rows in Table's column storage
+_MISSING = _Missing()
+
+# Bootstrap positioning utilities for each Toast position
+_TOAST_POSITION_CLASSES = MappingProxyType({
+    'top-start': 'top-0 start-0',
+    'top-center': 'top-0 start-50 translate-middle-x',
+    'top-end': 'top-0 end-0',
+    'middle-start': 'top-50 start-0 translate-middle-y',
+    'middle-center': 'top-50 start-50 translate-middle',
+    'middle-end': 'top-50 end-0 translate-middle-y',
+    'bottom-start': 'bottom-0 start-0',
+    'bottom-center': 'bottom-0 start-50 translate-middle-x',
+    'bottom-end': 'bottom-0 end-0'
+})
 
 class Table(ComponentBase):
     """Advanced table component with sorting, filtering, and pagination"""
@@ -24,30 +56,31 @@ class Table(ComponentBase):
         
         super().__init__(css_class="table-responsive")
         self.headers = headers
+        # Store cells column by column; rows are only rebuilt for rendering
         self.rows = rows
         self.sortable = sortable
         self.searchable = searchable
         self.pagination = pagination
         
         # Build table HTML
-        table_html = f'<table class="{table_class}" id="data-table">'
+        parts = [f'<table class="{table_class}" id="data-table">']
         
         # Headers
-        table_html += '<thead class="table-dark"><tr>'
+        parts.append('<thead class="table-dark"><tr>')
+        sort_icon = ' <i class="sort-icon">⇅</i>' if sortable else ''
         for i, header in enumerate(headers):
             sort_attr = f' data-sort="{i}" style="cursor: pointer;"' if sortable else ''
-            sort_icon = ' <i class="sort-icon">⇅</i>' if sortable else ''
-            table_html += f'<th{sort_attr}>{header}{sort_icon}</th>'
-        table_html += '</tr></thead>'
+            parts.append(f'<th{sort_attr}>{header}{sort_icon}</th>')
+        parts.append('</tr></thead>')
         
         # Body
-        table_html += '<tbody>'
-        for row in rows:
-            table_html += '<tr>'
-            for cell in row:
-                table_html += f'<td>{cell}</td>'
-            table_html += '</tr>'
-        table_html += '</tbody></table>'
+        parts.append('<tbody>')
+        for row in self.iter_rows():
+            parts.append('<tr>')
+            parts.extend(f'<td>{cell}</td>' for cell in row if cell is not _MISSING)
+            parts.append('</tr>')
+        parts.append('</tbody></table>')
+        table_html = ''.join(parts)
         
         # Add search and pagination if needed
         if searchable:
@@ -74,6 +107,30 @@ class Table(ComponentBase):
         
         self.content = table_html
     
+    @property
+    def rows(self):
+        """Rows rebuilt from the column storage"""
+        return [[cell for cell in row if cell is not _MISSING] for row in self.iter_rows()]
+    
+    @rows.setter
+    def rows(self, rows: List[List[str]]):
+        self.n_rows = len(rows)
+        self._columns = [list(column) for column in zip_longest(*rows, fillvalue=_MISSING)]
+    
+    def iter_rows(self):
+        """Iterate over the table rows as tuples"""
+        if not self._columns:
+            return iter([()] * self.n_rows)
+        return zip(*self._columns)
+    
+    def sorted_row_indices(self, column: int, reverse: bool = False):
+        """Row indices ordered by the values of one column; rows too short for it come last"""
+        values = self._columns[column]
+        present = [index for index, value in enumerate(values) if value is not _MISSING]
+        present.sort(key=values.__getitem__, reverse=reverse)
+        present.extend(index for index, value in enumerate(values) if value is _MISSING)
+        return present
+    
     def render(self):
         attrs = self.render_attributes()
         
@@ -176,8 +233,8 @@ class Tabs(ComponentBase):
         self.tabs_id = f"tabs-{str(uuid.uuid4())[:8]}"
         
         # Build tabs HTML
-        nav_html = f'<ul class="nav nav-tabs" id="{self.tabs_id}-nav" role="tablist">'
-        content_html = f'<div class="tab-content" id="{self.tabs_id}-content">'
+        nav_parts = [f'<ul class="nav nav-tabs" id="{self.tabs_id}-nav" role="tablist">']
+        content_parts = [f'<div class="tab-content" id="{self.tabs_id}-content">']
         
         for i, tab in enumerate(tabs):
             tab_id = f"{self.tabs_id}-tab-{i}"
@@ -185,7 +242,7 @@ class Tabs(ComponentBase):
             active_class = " active" if is_active else ""
             
             # Tab navigation
-            nav_html += f'''
+            nav_parts.append(f'''
             <li class="nav-item" role="presentation">
                 <button class="nav-link{active_class}" id="{tab_id}-tab" 
                         data-bs-toggle="tab" data-bs-target="#{tab_id}" 
@@ -194,7 +251,7 @@ class Tabs(ComponentBase):
                     {tab.get('title', f'Tab {i+1}')}
                 </button>
             </li>
-            '''
+            ''')
             
             # Tab content
             content = tab.get('content', '')
@@ -203,22 +260,29 @@ class Tabs(ComponentBase):
             elif isinstance(content, list):
                 content = ''.join([item.render() if hasattr(item, 'render') else str(item) for item in content])
             
-            content_html += f'''
+            content_parts.append(f'''
             <div class="tab-pane fade{" show active" if is_active else ""}" 
                  id="{tab_id}" role="tabpanel" aria-labelledby="{tab_id}-tab">
                 <div class="p-3">{content}</div>
             </div>
-            '''
+            ''')
         
-        nav_html += '</ul>'
-        content_html += '</div>'
+        nav_parts.append('</ul>')
+        content_parts.append('</div>')
         
-        self.content = nav_html + content_html
+        self.content = ''.join(nav_parts) + ''.join(content_parts)
+
+class CarouselItem(NamedTuple):
+    """A single Carousel slide: an image with optional caption, or free content"""
+    image: Optional[str] = None
+    alt: Optional[str] = None
+    caption: str = ''
+    content: Any = ''
 
 class Carousel(ComponentBase):
     """Image/content carousel component"""
     
-    def __init__(self, items: List[Dict[str, Any]], auto_slide: bool = True,
+    def __init__(self, items: List[Union[CarouselItem, Dict[str, Any]]], auto_slide: bool = True,
                  show_indicators: bool = True, show_controls: bool = True,
                  css_class: Optional[str] = None):
         carousel_class = "carousel slide"
@@ -226,7 +290,7 @@ class Carousel(ComponentBase):
             carousel_class += f" {css_class}"
         
         super().__init__(css_class=carousel_class)
-        self.items = items
+        self.items = items = tuple(_as_record(CarouselItem, item) for item in items)
         self.auto_slide = auto_slide
         
         # Generate unique ID
@@ -239,40 +303,39 @@ class Carousel(ComponentBase):
             self.set_attribute('data-bs-ride', 'carousel')
         
         # Build carousel HTML
-        carousel_html = ""
+        parts = []
         
         # Indicators
         if show_indicators:
-            indicators_html = '<div class="carousel-indicators">'
+            parts.append('<div class="carousel-indicators">')
             for i in range(len(items)):
                 active_class = " active" if i == 0 else ""
-                indicators_html += f'''
+                parts.append(f'''
                 <button type="button" data-bs-target="#{self.carousel_id}" 
                         data-bs-slide-to="{i}" class="{active_class.strip()}"
                         aria-current="true" aria-label="Slide {i+1}"></button>
-                '''
-            indicators_html += '</div>'
-            carousel_html += indicators_html
+                ''')
+            parts.append('</div>')
         
         # Carousel inner
-        inner_html = '<div class="carousel-inner">'
+        parts.append('<div class="carousel-inner">')
         for i, item in enumerate(items):
             active_class = " active" if i == 0 else ""
             
-            if 'image' in item:
+            if item.image is not None:
                 # Image slide
-                alt_text = item.get('alt', f'Slide {i+1}')
-                caption = item.get('caption', '')
+                alt_text = item.alt if item.alt is not None else f'Slide {i+1}'
+                caption = item.caption
                 
                 slide_html = f'''
                 <div class="carousel-item{active_class}">
-                    <img src="{item['image']}" class="d-block w-100" alt="{alt_text}">
+                    <img src="{item.image}" class="d-block w-100" alt="{alt_text}">
                     {f'<div class="carousel-caption d-none d-md-block"><p>{caption}</p></div>' if caption else ''}
                 </div>
                 '''
             else:
                 # Content slide
-                content = item.get('content', '')
+                content = item.content
                 if hasattr(content, 'render'):
                     content = content.render()
                 
@@ -284,10 +347,9 @@ class Carousel(ComponentBase):
                 </div>
                 '''
             
-            inner_html += slide_html
+            parts.append(slide_html)
         
-        inner_html += '</div>'
-        carousel_html += inner_html
+        parts.append('</div>')
         
         # Controls
         if show_controls:
@@ -303,9 +365,9 @@ class Carousel(ComponentBase):
                 <span class="visually-hidden">Next</span>
             </button>
             '''
-            carousel_html += controls_html
+            parts.append(controls_html)
         
-        self.content = carousel_html
+        self.content = ''.join(parts)
 
 class Breadcrumb(ComponentBase):
     """Navigation breadcrumb component"""
@@ -317,7 +379,7 @@ class Breadcrumb(ComponentBase):
         
         super().__init__(css_class=breadcrumb_class)
         
-        breadcrumb_html = '<nav aria-label="breadcrumb"><ol class="breadcrumb">'
+        parts = ['<nav aria-label="breadcrumb"><ol class="breadcrumb">']
         
         for i, item in enumerate(items):
             is_last = i == len(items) - 1
@@ -325,12 +387,12 @@ class Breadcrumb(ComponentBase):
             url = item.get('url', '#')
             
             if is_last or not url or url == '#':
-                breadcrumb_html += f'<li class="breadcrumb-item active" aria-current="page">{text}</li>'
+                parts.append(f'<li class="breadcrumb-item active" aria-current="page">{text}</li>')
             else:
-                breadcrumb_html += f'<li class="breadcrumb-item"><a href="{url}">{text}</a></li>'
+                parts.append(f'<li class="breadcrumb-item"><a href="{url}">{text}</a></li>')
         
-        breadcrumb_html += '</ol></nav>'
-        self.content = breadcrumb_html
+        parts.append('</ol></nav>')
+        self.content = ''.join(parts)
 
 class Pagination(ComponentBase):
     """Pagination component for multi-page content"""
@@ -343,54 +405,54 @@ class Pagination(ComponentBase):
         
         super().__init__(css_class=pagination_class)
         
-        pagination_html = '<nav aria-label="Page navigation"><ul class="pagination justify-content-center">'
+        parts = ['<nav aria-label="Page navigation"><ul class="pagination justify-content-center">']
         
         # Previous button
         prev_disabled = "disabled" if current_page <= 1 else ""
         prev_url = f"{base_url}{current_page - 1}" if current_page > 1 else "#"
-        pagination_html += f'''
+        parts.append(f'''
         <li class="page-item {prev_disabled}">
             <a class="page-link" href="{prev_url}" aria-label="Previous">
                 <span aria-hidden="true">&laquo;</span>
             </a>
         </li>
-        '''
+        ''')
         
         # Page numbers
         start_page = max(1, current_page - max_visible // 2)
         end_page = min(total_pages, start_page + max_visible - 1)
         
         if start_page > 1:
-            pagination_html += f'<li class="page-item"><a class="page-link" href="{base_url}1">1</a></li>'
+            parts.append(f'<li class="page-item"><a class="page-link" href="{base_url}1">1</a></li>')
             if start_page > 2:
-                pagination_html += '<li class="page-item disabled"><span class="page-link">...</span></li>'
+                parts.append('<li class="page-item disabled"><span class="page-link">...</span></li>')
         
         for page in range(start_page, end_page + 1):
             active_class = "active" if page == current_page else ""
-            pagination_html += f'''
+            parts.append(f'''
             <li class="page-item {active_class}">
                 <a class="page-link" href="{base_url}{page}">{page}</a>
             </li>
-            '''
+            ''')
         
         if end_page < total_pages:
             if end_page < total_pages - 1:
-                pagination_html += '<li class="page-item disabled"><span class="page-link">...</span></li>'
-            pagination_html += f'<li class="page-item"><a class="page-link" href="{base_url}{total_pages}">{total_pages}</a></li>'
+                parts.append('<li class="page-item disabled"><span class="page-link">...</span></li>')
+            parts.append(f'<li class="page-item"><a class="page-link" href="{base_url}{total_pages}">{total_pages}</a></li>')
         
         # Next button
         next_disabled = "disabled" if current_page >= total_pages else ""
         next_url = f"{base_url}{current_page + 1}" if current_page < total_pages else "#"
-        pagination_html += f'''
+        parts.append(f'''
         <li class="page-item {next_disabled}">
             <a class="page-link" href="{next_url}" aria-label="Next">
                 <span aria-hidden="true">&raquo;</span>
             </a>
         </li>
-        '''
+        ''')
         
-        pagination_html += '</ul></nav>'
-        self.content = pagination_html
+        parts.append('</ul></nav>')
+        self.content = ''.join(parts)
 
 class Toast(ComponentBase):
     """Toast notification component"""
@@ -434,19 +496,7 @@ class Toast(ComponentBase):
         attrs = self.render_attributes()
         
         # Toast container and positioning
-        position_classes = {
-            'top-start': 'top-0 start-0',
-            'top-center': 'top-0 start-50 translate-middle-x',
-            'top-end': 'top-0 end-0',
-            'middle-start': 'top-50 start-0 translate-middle-y',
-            'middle-center': 'top-50 start-50 translate-middle',
-            'middle-end': 'top-50 end-0 translate-middle-y',
-            'bottom-start': 'bottom-0 start-0',
-            'bottom-center': 'bottom-0 start-50 translate-middle-x',
-            'bottom-end': 'bottom-0 end-0'
-        }
-        
-        position_class = position_classes.get(self.position, 'top-0 end-0')
+        position_class = _TOAST_POSITION_CLASSES.get(self.position, 'top-0 end-0')
         
         container_html = f'''
         <div class="toast-container position-fixed {position_class} p-3" style="z-index: 11;">
@@ -487,7 +537,7 @@ class Rating(ComponentBase):
             self.set_id(self.rating_id)
         
         # Build rating HTML
-        rating_html = '<div class="rating-stars">'
+        parts = ['<div class="rating-stars">']
         
         for i in range(1, max_rating + 1):
             if i <= value:
@@ -501,12 +551,12 @@ class Rating(ComponentBase):
                 star_icon = "☆"
             
             if interactive:
-                rating_html += f'<span class="{star_class}" data-rating="{i}">{star_icon}</span>'
+                parts.append(f'<span class="{star_class}" data-rating="{i}">{star_icon}</span>')
             else:
-                rating_html += f'<span class="{star_class}">{star_icon}</span>'
+                parts.append(f'<span class="{star_class}">{star_icon}</span>')
         
-        rating_html += f'</div><span class="rating-value">{value}/{max_rating}</span>'
-        self.content = rating_html
+        parts.append(f'</div><span class="rating-value">{value}/{max_rating}</span>')
+        self.content = ''.join(parts)
     
     def render(self):
         attrs = self.render_attributes()
@@ -19,33 +19,44 @@ class Animation:
         """Generate CSS animation property"""
         return f"animation: {self.name} {self.duration} {self.timing} {self.delay} {self.fill_mode};"
 
-class FadeIn(Element):
-    """Fade in animation wrapper"""
+class _AnimationWrapper(Element):
+    """Shared base for the animation wrappers: a div around content plus the CSS it needs"""
     
-    def __init__(self, content, duration: str = "0.5s", delay: str = "0s", 
-                 css_class: Optional[str] = None):
+    def __init__(self, content, css_class: Optional[str] = None,
+                 animation_class: Optional[str] = None, animation_style: Optional[str] = None):
         super().__init__("div", css_class=css_class)
         self.content = content
-        self.duration = duration
-        self.delay = delay
-        
-        # Add animation styles
-        animation_style = f"opacity: 0; animation: fadeIn {duration} ease-in-out {delay} forwards;"
-        if self.style:
-            self.style += f" {animation_style}"
-        else:
-            self.style = animation_style
+        if animation_class:
+            self.add_class(animation_class)
+        if animation_style:
+            self.add_style(animation_style)
+    
+    def _assets(self) -> str:
+        """Return the style/script markup emitted before the wrapper"""
+        return ""
     
     def render(self):
         attrs = self.render_attributes()
-        content_html = ""
         if hasattr(self.content, 'render'):
             content_html = self.content.render()
         else:
             content_html = str(self.content)
         
+        return f"{self._assets()}<{self.tag}{attrs}>{content_html}</{self.tag}>"
+
+class FadeIn(_AnimationWrapper):
+    """Fade in animation wrapper"""
+    
+    def __init__(self, content, duration: str = "0.5s", delay: str = "0s", 
+                 css_class: Optional[str] = None):
+        super().__init__(content, css_class=css_class,
+                         animation_style=f"opacity: 0; animation: fadeIn {duration} ease-in-out {delay} forwards;")
+        self.duration = duration
+        self.delay = delay
+    
+    def _assets(self) -> str:
         # Add CSS keyframes
-        css = """
+        return """
         <style>
         @keyframes fadeIn {
             from { opacity: 0; }
@@ -53,37 +64,21 @@ class FadeIn(Element):
         }
         </style>
         """
-        
-        return f"{css}<{self.tag}{attrs}>{content_html}</{self.tag}>"
 
-class SlideUp(Element):
+class SlideUp(_AnimationWrapper):
     """Slide up animation wrapper"""
     
     def __init__(self, content, duration: str = "0.5s", delay: str = "0s", 
                  distance: str = "30px", css_class: Optional[str] = None):
-        super().__init__("div", css_class=css_class)
-        self.content = content
+        super().__init__(content, css_class=css_class,
+                         animation_style=f"transform: translateY({distance}); opacity: 0; animation: slideUp {duration} ease-out {delay} forwards;")
         self.duration = duration
         self.delay = delay
         self.distance = distance
-        
-        # Add animation styles
-        animation_style = f"transform: translateY({distance}); opacity: 0; animation: slideUp {duration} ease-out {delay} forwards;"
-        if self.style:
-            self.style += f" {animation_style}"
-        else:
-            self.style = animation_style
     
-    def render(self):
-        attrs = self.render_attributes()
-        content_html = ""
-        if hasattr(self.content, 'render'):
-            content_html = self.content.render()
-        else:
-            content_html = str(self.content)
-        
+    def _assets(self) -> str:
         # Add CSS keyframes
-        css = f"""
+        return f"""
         <style>
         @keyframes slideUp {{
             from {{ 
@@ -97,36 +92,19 @@ class SlideUp(Element):
         }}
         </style>
         """
-        
-        return f"{css}<{self.tag}{attrs}>{content_html}</{self.tag}>"
 
-class AnimateOnScroll(Element):
+class AnimateOnScroll(_AnimationWrapper):
     """Animate element when it comes into view"""
     
     def __init__(self, content, animation_type: str = "fadeIn", 
                  duration: str = "0.6s", threshold: float = 0.1, 
                  css_class: Optional[str] = None):
-        super().__init__("div", css_class=css_class)
-        self.content = content
+        super().__init__(content, css_class=css_class, animation_class="animate-on-scroll")
         self.animation_type = animation_type
         self.duration = duration
         self.threshold = threshold
-        
-        # Add observer class
-        observer_class = "animate-on-scroll"
-        if self.css_class:
-            self.css_class += f" {observer_class}"
-        else:
-            self.css_class = observer_class
     
-    def render(self):
-        attrs = self.render_attributes()
-        content_html = ""
-        if hasattr(self.content, 'render'):
-            content_html = self.content.render()
-        else:
-            content_html = str(self.content)
-        
+    def _assets(self) -> str:
         # Animation CSS and JavaScript
         animation_css = f"""
         <style>
@@ -196,32 +174,17 @@ class AnimateOnScroll(Element):
         </script>
         """
         
-        return f"{animation_css}{animation_js}<{self.tag}{attrs}>{content_html}</{self.tag}>"
+        return animation_css + animation_js
 
-class Pulse(Element):
+class Pulse(_AnimationWrapper):
     """Pulse animation for highlighting elements"""
     
     def __init__(self, content, duration: str = "1s", css_class: Optional[str] = None):
-        super().__init__("div", css_class=css_class)
-        self.content = content
+        super().__init__(content, css_class=css_class, animation_class="pulse-animation")
         self.duration = duration
-        
-        # Add pulse class
-        pulse_class = "pulse-animation"
-        if self.css_class:
-            self.css_class += f" {pulse_class}"
-        else:
-            self.css_class = pulse_class
     
-    def render(self):
-        attrs = self.render_attributes()
-        content_html = ""
-        if hasattr(self.content, 'render'):
-            content_html = self.content.render()
-        else:
-            content_html = str(self.content)
-        
-        css = f"""
+    def _assets(self) -> str:
+        return f"""
         <style>
         .pulse-animation {{
             animation: pulse {self.duration} infinite;
@@ -234,5 +197,3 @@ class Pulse(Element):
         }}
         </style>
         """
-        
-        return f"{css}<{self.tag}{attrs}>{content_html}</{self.tag}>"
\ No newline at end of file
@@ -1,13 +1,28 @@
+from functools import lru_cache
+import sys
 from typing import List as ListType, Dict, Any, Optional, Union
-from .elements import Element, Container, Paragraph
+from .elements import Element, Container, Paragraph, _emit_items
 from .page import Heading
 
+def _as_record(record_type, item):
+    """Convert a dict item into the given NamedTuple type, ignoring unknown keys"""
+    if isinstance(item, dict):
+        return record_type(**{key: item[key] for key in record_type._fields if key in item})
+    return item
+
 class ComponentBase(Element):
     """Base class for creating custom components"""
     
+    __slots__ = ('css_class', 'style', 'child_elements')
+    
     def __init__(self, tag: str = "div", css_class: Optional[str] = None, 
                  id_attr: Optional[str] = None, style: Optional[str] = None):
+        # Component trees repeat a handful of class strings; keep one shared object per string
+        if css_class:
+            css_class = sys.intern(css_class)
         super().__init__(tag, css_class=css_class, id_attr=id_attr, style=style)
+        self.css_class = css_class or ""
+        self.style = style or ""
         self.child_elements = []
     
     def add_element(self, element):
@@ -17,15 +32,14 @@ class ComponentBase(Element):
     
     def render(self):
         """Render the component with all child elements"""
-        content = ""
-        for element in self.child_elements:
-            if hasattr(element, 'render'):
-                content += element.render()
-            else:
-                content += str(element)
-        
-        attrs = self.render_attributes()
-        return f"<{self.tag}{attrs}>{content}</{self.tag}>"
+        parts = [f"<{self.tag}{self.render_attributes()}>", self.content]
+        self._emit_children(parts)
+        parts.append(f"</{self.tag}>")
+        return "".join(parts)
+    
+    def _emit_children(self, parts):
+        """Append the HTML of every child element to parts"""
+        _emit_items(self.child_elements, parts)
 
 class HeroSection(ComponentBase):
     """Hero section component"""
@@ -63,17 +77,14 @@ class FeatureCard(ComponentBase):
         super().__init__(css_class=card_class)
         
         # Build card content
-        card_html = '<div class="card h-100 text-center">'
-        card_html += '<div class="card-body">'
+        parts = ['<div class="card h-100 text-center"><div class="card-body">']
         
         if icon:
-            card_html += f'<div class="mb-3"><i class="{icon} fa-3x text-primary"></i></div>'
+            parts.append(f'<div class="mb-3"><i class="{icon} fa-3x text-primary"></i></div>')
         
-        card_html += f'<h5 class="card-title">{title}</h5>'
-        card_html += f'<p class="card-text">{description}</p>'
-        card_html += '</div></div>'
+        parts.append(f'<h5 class="card-title">{title}</h5><p class="card-text">{description}</p></div></div>')
         
-        self.content = card_html
+        self.content = ''.join(parts)
 
 class Navbar(ComponentBase):
     """Navigation bar component"""
@@ -104,10 +115,10 @@ class Navbar(ComponentBase):
         '''
         
         if nav_items:
-            for item in nav_items:
-                navbar_html += f'<li class="nav-item">'
-                navbar_html += f'<a class="nav-link" href="{item.get("url", "#")}">{item.get("text", "Link")}</a>'
-                navbar_html += '</li>'
+            navbar_html += "".join(
+                f'<li class="nav-item"><a class="nav-link" href="{item.get("url", "#")}">{item.get("text", "Link")}</a></li>'
+                for item in nav_items
+            )
         
         navbar_html += '''
                 </ul>
@@ -140,6 +151,8 @@ class Alert(ComponentBase):
 class Badge(Element):
     """Bootstrap badge component"""
     
+    __slots__ = ()
+    
     def __init__(self, text: str, badge_type: str = "secondary", 
                  css_class: Optional[str] = None):
         badge_class = f"badge bg-{badge_type}"
@@ -147,6 +160,12 @@ class Badge(Element):
             badge_class += f" {css_class}"
         
         super().__init__("span", text, css_class=badge_class)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def shared(cls, text: str, badge_type: str = "secondary", css_class: Optional[str] = None) -> str:
+        """Return the rendered badge HTML, shared between calls with the same arguments"""
+        return cls(text, badge_type, css_class).render()
 
 class ProgressBar(ComponentBase):
     """Bootstrap progress bar component"""
@@ -177,28 +196,10 @@ class ProgressBar(ComponentBase):
         attrs = self.render_attributes()
         return f"<{self.tag}{attrs}>{self.content}</{self.tag}>"
 
-class Accordion(ComponentBase):
-    """Bootstrap accordion component"""
-    
-    def __init__(self, accordion_id: str = "accordion", css_class: Optional[str] = None):
-        accordion_class = "accordion"
-        if css_class:
-            accordion_class += f" {css_class}"
-        
-        super().__init__(css_class=accordion_class)
-        self.set_id(accordion_id)
-        self.accordion_id = accordion_id
-        self.items = []
-    
-    def add_item(self, title: str, content: str, expanded: bool = False):
-        """Add an accordion item"""
-        item_id = f"{self.accordion_id}-item-{len(self.items)}"
-        collapse_id = f"{self.accordion_id}-collapse-{len(self.items)}"
-        
-        item_html = f'''
+_ACCORDION_ITEM_HTML = '''
         <div class="accordion-item">
             <h2 class="accordion-header" id="{item_id}">
-                <button class="accordion-button{'collapsed' if not expanded else ''}" 
+                <button class="accordion-button{button_state}" 
                         type="button" 
                         data-bs-toggle="collapse" 
                         data-bs-target="#{collapse_id}">
@@ -206,18 +207,55 @@ class Accordion(ComponentBase):
                 </button>
             </h2>
             <div id="{collapse_id}" 
-                 class="accordion-collapse collapse{' show' if expanded else ''}" 
-                 data-bs-parent="#{self.accordion_id}">
+                 class="accordion-collapse collapse{show}" 
+                 data-bs-parent="#{accordion_id}">
                 <div class="accordion-body">
                     {content}
                 </div>
             </div>
         </div>
         '''
+
+class Accordion(ComponentBase):
+    """Bootstrap accordion component"""
+    
+    def __init__(self, accordion_id: str = "accordion", css_class: Optional[str] = None):
+        accordion_class = "accordion"
+        if css_class:
+            accordion_class += f" {css_class}"
         
-        self.items.append(item_html)
+        super().__init__(css_class=accordion_class)
+        self.set_id(accordion_id)
+        self.accordion_id = accordion_id
+        self.items = []
+    
+    def add_item(self, title: str, content: str, expanded: bool = False):
+        """Add an accordion item"""
+        self.items.append(self._item_html(len(self.items), title, content, expanded))
         return self
     
+    def add_items(self, items):
+        """Add several accordion items from (title, content[, expanded]) tuples or dicts"""
+        start = len(self.items)
+        self.items.extend(
+            self._item_html(start + i, item['title'], item['content'], item.get('expanded', False))
+            if isinstance(item, dict) else self._item_html(start + i, *item)
+            for i, item in enumerate(items)
+        )
+        return self
+    
+    def _item_html(self, index: int, title: str, content: str, expanded: bool = False):
+        """Build the markup for the accordion item at the given position"""
+        return _ACCORDION_ITEM_HTML.format(
+            item_id=f"{self.accordion_id}-item-{index}",
+            collapse_id=f"{self.accordion_id}-collapse-{index}",
+            accordion_id=self.accordion_id,
+            button_state='' if expanded else ' collapsed',
+            show=' show' if expanded else '',
+            title=title,
+            content=content,
+        )
+    
     def render(self):
         """Render the accordion with all items"""
         self.content = "".join(self.items)
@@ -1,20 +1,38 @@
 from typing import Dict, Any, Optional
 
+# Bootstrap grid breakpoints used by responsive_breakpoints
+_MEDIA_SM = "(min-width: 576px)"
+_MEDIA_MD = "(min-width: 768px)"
+_MEDIA_LG = "(min-width: 992px)"
+_MEDIA_XL = "(min-width: 1200px)"
+
 class CSSBuilder:
     """CSS builder for creating inline and external styles"""
     
     def __init__(self):
         self.rules = {}
         self.media_queries = {}
+        
+        # Rendered stylesheet, reused until a rule changes
+        self._css_cache = None
+
+    def __setattr__(self, name, value):
+        # Replacing rules or media_queries invalidates the cached stylesheet
+        if not name.startswith('_'):
+            object.__setattr__(self, '_css_cache', None)
+        object.__setattr__(self, name, value)
 
     def add_rule(self, selector: str, properties: Dict[str, str]):
-        """Add a CSS rule"""
-        self.rules[selector] = properties
+        """Add a CSS rule, copying its properties"""
+        self._css_cache = None
+        self.rules[selector] = dict(properties)
         return self
 
     def add_media_query(self, media: str, rules: Dict[str, Dict[str, str]]):
-        """Add media query rules"""
-        self.media_queries[media] = rules
+        """Add media query rules, merging them into any existing block for the same media"""
+        self._css_cache = None
+        self.media_queries.setdefault(media, {}).update(
+            (selector, dict(properties)) for selector, properties in rules.items())
         return self
 
     def responsive_breakpoints(self, selector: str, 
@@ -24,40 +42,41 @@ class CSSBuilder:
                              lg: Optional[Dict[str, str]] = None,
                              xl: Optional[Dict[str, str]] = None):
         """Add responsive breakpoint rules"""
+        self._css_cache = None
         if xs:
-            self.rules[selector] = xs
-        if sm:
-            self.add_media_query("(min-width: 576px)", {selector: sm})
-        if md:
-            self.add_media_query("(min-width: 768px)", {selector: md})
-        if lg:
-            self.add_media_query("(min-width: 992px)", {selector: lg})
-        if xl:
-            self.add_media_query("(min-width: 1200px)", {selector: xl})
+            self.rules[selector] = dict(xs)
+        for media, properties in ((_MEDIA_SM, sm), (_MEDIA_MD, md), (_MEDIA_LG, lg), (_MEDIA_XL, xl)):
+            if properties:
+                # Merge into the breakpoint's block so earlier selectors are kept
+                self.media_queries.setdefault(media, {})[selector] = dict(properties)
         return self
 
     def render(self):
         """Render the CSS as a string"""
-        css = ""
+        if self._css_cache is None:
+            self._css_cache = self._render_css()
+        return self._css_cache
+
+    def _render_css(self):
+        """Build the CSS text from the current rules and media queries"""
+        parts = []
         
         # Regular rules
         for selector, properties in self.rules.items():
-            css += f"{selector} {{\n"
-            for prop, value in properties.items():
-                css += f"    {prop}: {value};\n"
-            css += "}\n\n"
+            parts.append(f"{selector} {{\n")
+            parts.extend(f"    {prop}: {value};\n" for prop, value in properties.items())
+            parts.append("}\n\n")
         
         # Media queries
         for media, rules in self.media_queries.items():
-            css += f"@media {media} {{\n"
+            parts.append(f"@media {media} {{\n")
             for selector, properties in rules.items():
-                css += f"    {selector} {{\n"
-                for prop, value in properties.items():
-                    css += f"        {prop}: {value};\n"
-                css += "    }\n"
-            css += "}\n\n"
+                parts.append(f"    {selector} {{\n")
+                parts.extend(f"        {prop}: {value};\n" for prop, value in properties.items())
+                parts.append("    }\n")
+            parts.append("}\n\n")
         
-        return css
+        return "".join(parts)
 
 class Style:
     """Individual style builder with method chaining"""
@@ -128,11 +147,10 @@ class Style:
 
     def render(self):
         """Render the style as CSS"""
-        css = f"{self.selector} {{\n"
-        for prop, value in self.properties.items():
-            css += f"    {prop}: {value};\n"
-        css += "}\n"
-        return css
+        parts = [f"{self.selector} {{\n"]
+        parts.extend(f"    {prop}: {value};\n" for prop, value in self.properties.items())
+        parts.append("}\n")
+        return "".join(parts)
         self.properties['background-color'] = value
         return self
 
@@ -201,8 +219,7 @@ class Style:
         if not self.properties:
             return ""
         
-        css = f"{self.selector} {{\n"
-        for prop, value in self.properties.items():
-            css += f"    {prop}: {value};\n"
-        css += "}\n"
-        return css
+        parts = [f"{self.selector} {{\n"]
+        parts.extend(f"    {prop}: {value};\n" for prop, value in self.properties.items())
+        parts.append("}\n")
+        return "".join(parts)
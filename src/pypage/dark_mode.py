@@ -192,18 +192,17 @@ class ThemeProvider:
     
     def generate_theme_css(self) -> str:
         """Generate CSS for all registered themes"""
-        css = ":root {\n"
-        for var, value in self.themes['light'].items():
-            css += f"    {var}: {value};\n"
-        css += "}\n\n"
+        parts = [":root {\n"]
+        parts.extend(f"    {var}: {value};\n" for var, value in self.themes['light'].items())
+        parts.append("}\n\n")
         
         for theme_name, variables in self.themes.items():
             if theme_name != 'light':
-                css += f'[data-theme="{theme_name}"] {{\n'
-                for var, value in variables.items():
-                    css += f"    {var}: {value};\n"
-                css += "}\n\n"
+                parts.append(f'[data-theme="{theme_name}"] {{\n')
+                parts.extend(f"    {var}: {value};\n" for var, value in variables.items())
+                parts.append("}\n\n")
         
+        css = "".join(parts)
         return f"<style>\n{css}</style>"
 
 def create_auto_dark_mode() -> str:
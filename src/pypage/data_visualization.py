@@ -1,10 +1,72 @@
 """
 Data visualization components using Chart.js and modern charting
 """
+import base64
+import io
+import json
+import math
+import re
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Optional, List, Dict, Any, Union
 from .elements import Element
 from .components import ComponentBase
 
+# orjson is optional; it serializes chart data, including numpy arrays, in one native pass
+_HAS_ORJSON = find_spec("orjson") is not None
+orjson = None
+
+def _load_orjson():
+    """Import orjson on first use so that plain HTML rendering never loads it"""
+    global orjson
+    if orjson is None and _HAS_ORJSON:
+        import orjson as module
+        orjson = module
+    return orjson
+
+def _json_default(obj):
+    """Serialize array-likes such as numpy arrays and scalars for the stdlib encoder"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _finite(obj):
+    """Replace NaN and infinite floats with None, matching what orjson emits"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    if hasattr(obj, 'tolist'):
+        return _finite(obj.tolist())
+    return obj
+
+def _to_js(obj) -> str:
+    """Serialize chart data or options to a JavaScript literal; NaN and infinity become null"""
+    if _load_orjson() is not None:
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    try:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_json_default,
+                          allow_nan=False)
+    except ValueError:
+        # Only data with gaps pays for the extra pass
+        return json.dumps(_finite(obj), separators=(',', ':'), ensure_ascii=False, default=_json_default)
+
+def _size_in_inches(size: str, default: float) -> float:
+    """Convert a CSS pixel size such as '400px' to inches at 96 DPI"""
+    match = re.match(r'\s*(\d+(?:\.\d+)?)', str(size))
+    return float(match.group(1)) / 96 if match else default
+
+def _mpl_color(color):
+    """Pass through colors matplotlib understands; leave the rest to its defaults"""
+    if isinstance(color, str) and color.startswith('#'):
+        return color
+    if isinstance(color, list) and all(isinstance(c, str) and c.startswith('#') for c in color):
+        return color
+    return None
+
 class Chart(ComponentBase):
     """Interactive chart component using Chart.js"""
     
@@ -34,6 +96,61 @@ class Chart(ComponentBase):
         '''
         
         self.content = canvas_html
+        self._svg = None
+    
+    def to_svg(self) -> bytes:
+        """Render the chart as static SVG with matplotlib, cached after the first call"""
+        if self._svg is None:
+            try:
+                # A bare Figure needs no pyplot state and leaves the host's backend alone
+                from matplotlib.figure import Figure
+            except ImportError:
+                raise ImportError("Static chart export requires matplotlib. Install pypage[charts].")
+            
+            fig = Figure(figsize=(_size_in_inches(self.width, 4.0),
+                                  _size_in_inches(self.height, 3.0)))
+            ax = fig.subplots()
+            labels = self.data.get('labels', [])
+            datasets = self.data.get('datasets', [])
+            
+            if self.chart_type in ('pie', 'doughnut'):
+                dataset = datasets[0] if datasets else {}
+                wedgeprops = {'width': 0.4} if self.chart_type == 'doughnut' else None
+                ax.pie(dataset.get('data', []), labels=labels,
+                       colors=_mpl_color(dataset.get('backgroundColor')), wedgeprops=wedgeprops)
+                ax.axis('equal')
+            elif self.chart_type == 'bar':
+                positions = range(len(labels))
+                bar_width = 0.8 / max(len(datasets), 1)
+                for i, dataset in enumerate(datasets):
+                    ax.bar([x + i * bar_width for x in positions], dataset.get('data', []),
+                           bar_width, label=dataset.get('label'),
+                           color=_mpl_color(dataset.get('backgroundColor')))
+                ax.set_xticks([x + bar_width * (len(datasets) - 1) / 2 for x in positions])
+                ax.set_xticklabels(labels)
+            else:
+                for dataset in datasets:
+                    ax.plot(labels, dataset.get('data', []), label=dataset.get('label'),
+                            color=_mpl_color(dataset.get('borderColor')))
+            
+            if self.chart_type not in ('pie', 'doughnut') and any(d.get('label') for d in datasets):
+                ax.legend()
+            
+            title = self.options.get('plugins', {}).get('title', {})
+            if title.get('display'):
+                ax.set_title(title.get('text', ''))
+            
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='svg', bbox_inches='tight')
+            self._svg = buffer.getvalue()
+        return self._svg
+    
+    def render_static(self):
+        """Render the chart as an inline SVG image, for PDF export where scripts do not run"""
+        attrs = self.render_attributes()
+        svg_data = base64.b64encode(self.to_svg()).decode('ascii')
+        img_html = f'<img src="data:image/svg+xml;base64,{svg_data}" alt="{self.chart_type} chart" style="max-width: 100%;">'
+        return f"<{self.tag}{attrs}>{img_html}</{self.tag}>"
     
     def render(self):
         attrs = self.render_attributes()
@@ -57,8 +174,7 @@ class Chart(ComponentBase):
     
     def _dict_to_js(self, obj):
         """Convert Python dict to JavaScript object string"""
-        import json
-        return json.dumps(obj)
+        return _to_js(obj)
 
 class BarChart(Chart):
     """Bar chart component"""
@@ -117,16 +233,13 @@ class PieChart(Chart):
         
         # Default colors
         if not colors:
-            colors = [
-                '#FF6384', '#36A2EB', '#FFCE56', '#4BC0C0', '#9966FF',
-                '#FF9F40', '#FF6384', '#C9CBCF', '#4BC0C0', '#FF6384'
-            ]
+            colors = DEFAULT_CHART_COLORS
         
         data = {
             'labels': labels,
             'datasets': [{
                 'data': data_values,
-                'backgroundColor': colors[:len(labels)],
+                'backgroundColor': list(colors[:len(labels)]),
                 'borderWidth': 1
             }]
         }
@@ -154,16 +267,13 @@ class DoughnutChart(Chart):
         
         # Default colors
         if not colors:
-            colors = [
-                '#FF6384', '#36A2EB', '#FFCE56', '#4BC0C0', '#9966FF',
-                '#FF9F40', '#FF6384', '#C9CBCF', '#4BC0C0', '#FF6384'
-            ]
+            colors = DEFAULT_CHART_COLORS
         
         data = {
             'labels': labels,
             'datasets': [{
                 'data': data_values,
-                'backgroundColor': colors[:len(labels)],
+                'backgroundColor': list(colors[:len(labels)]),
                 'borderWidth': 1
             }]
         }
@@ -196,11 +306,11 @@ class Dashboard(ComponentBase):
         super().__init__(css_class=dashboard_class)
         
         # Build dashboard HTML
-        dashboard_html = f'<div class="dashboard-header"><h2>{title}</h2></div>'
+        parts = [f'<div class="dashboard-header"><h2>{title}</h2></div>']
         
         # Metrics row
         if metrics:
-            dashboard_html += '<div class="dashboard-metrics row">'
+            parts.append('<div class="dashboard-metrics row">')
             for metric in metrics:
                 metric_html = f'''
                 <div class="col-md-3">
@@ -213,25 +323,25 @@ class Dashboard(ComponentBase):
                     </div>
                 </div>
                 '''
-                dashboard_html += metric_html
-            dashboard_html += '</div>'
+                parts.append(metric_html)
+            parts.append('</div>')
         
         # Charts row
         if charts:
-            dashboard_html += '<div class="dashboard-charts row mt-4">'
+            parts.append('<div class="dashboard-charts row mt-4">')
             chart_width = 12 // min(len(charts), 3)  # Max 3 charts per row
             
             for i, chart in enumerate(charts):
                 if i % 3 == 0 and i > 0:
-                    dashboard_html += '</div><div class="dashboard-charts row mt-4">'
+                    parts.append('</div><div class="dashboard-charts row mt-4">')
                 
-                dashboard_html += f'<div class="col-md-{chart_width}">'
-                dashboard_html += chart.render()
-                dashboard_html += '</div>'
+                parts.append(f'<div class="col-md-{chart_width}">')
+                chart.render_to(parts)
+                parts.append('</div>')
             
-            dashboard_html += '</div>'
+            parts.append('</div>')
         
-        self.content = dashboard_html
+        self.content = ''.join(parts)
     
     def render(self):
         attrs = self.render_attributes()
@@ -285,6 +395,27 @@ class Dashboard(ComponentBase):
         
         return f"{dashboard_css}<{self.tag}{attrs}>{self.content}</{self.tag}>"
 
+# Default slice colors for pie and doughnut charts
+DEFAULT_CHART_COLORS = (
+    '#FF6384', '#36A2EB', '#FFCE56', '#4BC0C0', '#9966FF',
+    '#FF9F40', '#FF6384', '#C9CBCF', '#4BC0C0', '#FF6384'
+)
+
+@lru_cache(maxsize=256)
+def _sparkline_path(data_points: tuple, svg_width: int, svg_height: int) -> str:
+    """Build the SVG path for a sparkline; repeated trends reuse the cached path"""
+    min_val = min(data_points)
+    max_val = max(data_points)
+    range_val = max_val - min_val if max_val != min_val else 1
+    last_index = len(data_points) - 1
+    
+    points = [
+        f"{(i / last_index) * svg_width if last_index else 0},"
+        f"{svg_height - ((value - min_val) / range_val) * svg_height}"
+        for i, value in enumerate(data_points)
+    ]
+    return "M " + " L ".join(points)
+
 class SparklineChart(ComponentBase):
     """Compact sparkline chart for trends"""
     
@@ -305,21 +436,10 @@ class SparklineChart(ComponentBase):
         if not data_points:
             data_points = [0]
         
-        min_val = min(data_points)
-        max_val = max(data_points)
-        range_val = max_val - min_val if max_val != min_val else 1
-        
         # Calculate points for SVG path
-        points = []
         svg_width = 100
         svg_height = 30
-        
-        for i, value in enumerate(data_points):
-            x = (i / (len(data_points) - 1)) * svg_width if len(data_points) > 1 else 0
-            y = svg_height - ((value - min_val) / range_val) * svg_height
-            points.append(f"{x},{y}")
-        
-        path_data = "M " + " L ".join(points)
+        path_data = _sparkline_path(tuple(data_points), svg_width, svg_height)
         
         sparkline_html = f'''
         <svg width="{width}" height="{height}" viewBox="0 0 {svg_width} {svg_height}" 
@@ -348,6 +468,22 @@ class SparklineChart(ComponentBase):
         
         return f"{sparkline_css}<{self.tag}{attrs}>{self.content}</{self.tag}>"
 
+_KPI_CARD_HTML = '''
+        <div class="card-body">
+            <div class="d-flex justify-content-between align-items-start">
+                <div class="kpi-content">
+                    <h6 class="kpi-title text-muted">{title}</h6>
+                    <h3 class="kpi-value">{value}</h3>
+                    {change}
+                </div>
+                <div class="kpi-visual">
+                    {icon}
+                    {sparkline}
+                </div>
+            </div>
+        </div>
+        '''
+
 class KPICard(ComponentBase):
     """Key Performance Indicator card with trend"""
     
@@ -363,23 +499,13 @@ class KPICard(ComponentBase):
         # Create sparkline for trend
         sparkline = SparklineChart(trend_data, width="80px", height="40px")
         
-        kpi_html = f'''
-        <div class="card-body">
-            <div class="d-flex justify-content-between align-items-start">
-                <div class="kpi-content">
-                    <h6 class="kpi-title text-muted">{title}</h6>
-                    <h3 class="kpi-value">{value}</h3>
-                    {f'<small class="kpi-change text-{change_type}">{change}</small>' if change else ''}
-                </div>
-                <div class="kpi-visual">
-                    {f'<i class="{icon} kpi-icon"></i>' if icon else ''}
-                    {sparkline.render()}
-                </div>
-            </div>
-        </div>
-        '''
-        
-        self.content = kpi_html
+        self.content = _KPI_CARD_HTML.format_map({
+            'title': title,
+            'value': value,
+            'change': f'<small class="kpi-change text-{change_type}">{change}</small>' if change else '',
+            'icon': f'<i class="{icon} kpi-icon"></i>' if icon else '',
+            'sparkline': sparkline.render(),
+        })
     
     def render(self):
         attrs = self.render_attributes()
@@ -1,36 +1,153 @@
+import copy
+import sys
+from html import escape as _escape
 from typing import List as ListType, Dict, Any, Optional
 
+def escape_html(text: Any) -> str:
+    """Escape text for safe use in HTML content or attribute values"""
+    if text.__class__ is not str:
+        text = str(text)
+    # Most labels and URLs contain nothing to escape; skip the replace passes for them
+    if '&' in text or '<' in text or '>' in text or '"' in text or "'" in text:
+        return _escape(text)
+    return text
+
+def _emit_items(items, parts):
+    """Append the HTML of a sequence of elements or strings to parts"""
+    for item in items:
+        if hasattr(item, 'render_to'):
+            item.render_to(parts)
+        elif hasattr(item, 'render'):
+            parts.append(item.render())
+        else:
+            parts.append(str(item))
+
+def _join_attributes(attrs):
+    """Render an attribute dict as a string of name="value" pairs"""
+    if len(attrs) == 1:
+        # Most elements carry just a class or href; skip the list and join
+        for key, value in attrs.items():
+            return f' {key}="{value}"'
+    return "".join([f' {key}="{value}"' for key, value in attrs.items()])
+
+class _Attributes(dict):
+    """Attribute dict that keeps its rendered string until it is written to"""
+    
+    __slots__ = ('rendered',)
+    
+    def __init__(self, items=()):
+        dict.__init__(self, items)
+        self.rendered = None
+    
+    def __reduce__(self):
+        return (_Attributes, (dict(self),))
+    
+    def __setitem__(self, key, value):
+        self.rendered = None
+        dict.__setitem__(self, key, value)
+    
+    def __delitem__(self, key):
+        self.rendered = None
+        dict.__delitem__(self, key)
+    
+    def __ior__(self, other):
+        self.rendered = None
+        return dict.__ior__(self, other)
+    
+    def clear(self):
+        self.rendered = None
+        dict.clear(self)
+    
+    def pop(self, *args):
+        self.rendered = None
+        return dict.pop(self, *args)
+    
+    def popitem(self):
+        self.rendered = None
+        return dict.popitem(self)
+    
+    def setdefault(self, key, default=None):
+        self.rendered = None
+        return dict.setdefault(self, key, default)
+    
+    def update(self, *args, **kwargs):
+        self.rendered = None
+        dict.update(self, *args, **kwargs)
+
 class Element:
     """Base class for all HTML elements"""
     
+    __slots__ = ('_tag', '_text', '_attributes', '_html_attrs', '_html')
+    
     def __init__(self, tag: str, content: str = "", attributes: Optional[Dict[str, str]] = None,
                  css_class: Optional[str] = None, id_attr: Optional[str] = None,
                  style: Optional[str] = None, class_name: Optional[str] = None):
-        self.tag = tag
+        self.tag = sys.intern(tag)
         self.content = content
-        self.attributes = attributes if attributes is not None else {}
+        attrs = attributes
         
         # Handle class_name parameter (alias for css_class)
         final_class = class_name or css_class
-        if final_class:
-            self.attributes['class'] = final_class
-        if id_attr:
-            self.attributes['id'] = id_attr
-        if style:
-            self.attributes['style'] = style
+        if final_class or id_attr or style:
+            owned = attrs is None
+            if owned:
+                attrs = {}
+            if final_class:
+                attrs['class'] = final_class
+            if id_attr:
+                attrs['id'] = id_attr
+            if style:
+                attrs['style'] = style
+            if owned:
+                attrs = _Attributes(attrs)
+        
+        # Attribute-less elements don't allocate a dict until one is requested.
+        # A dict passed in by the caller is kept as-is and rendered fresh each time.
+        self._attributes = attrs
+        self._html_attrs = None
+
+    @property
+    def tag(self):
+        """HTML tag name"""
+        return self._tag
+
+    @tag.setter
+    def tag(self, value):
+        self._tag = value
+        self._html = None
+
+    @property
+    def content(self):
+        """Element content"""
+        return self._text
+
+    @content.setter
+    def content(self, value):
+        self._text = value
+        self._html = None
+
+    @property
+    def attributes(self) -> Dict[str, str]:
+        """HTML attributes"""
+        if self._attributes is None:
+            self._attributes = _Attributes()
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, value: Dict[str, str]):
+        self._attributes = value
+        self._html = None
 
     def set_attribute(self, name: str, value: str):
         """Set an attribute on the element"""
-        self.attributes[name] = value
+        self.attributes[sys.intern(name)] = value
         return self
 
     def add_class(self, css_class: str):
         """Add a CSS class to the element"""
-        current_class = self.attributes.get('class', '')
-        if current_class:
-            self.attributes['class'] = f"{current_class} {css_class}"
-        else:
-            self.attributes['class'] = css_class
+        attrs = self.attributes
+        current_class = attrs.get('class')
+        attrs['class'] = f"{current_class} {css_class}" if current_class else css_class
         return self
 
     def set_id(self, id_attr: str):
@@ -45,19 +162,19 @@ class Element:
     
     def add_style(self, style: str):
         """Add to existing inline CSS styles"""
-        current_style = self.attributes.get('style', '')
+        attrs = self.attributes
+        current_style = attrs.get('style')
         if current_style:
             # Add semicolon if not present
-            if not current_style.rstrip().endswith(';'):
-                current_style += '; '
-            else:
-                current_style += ' '
-        self.attributes['style'] = current_style + style
+            separator = ' ' if current_style.rstrip().endswith(';') else '; '
+            attrs['style'] = f"{current_style}{separator}{style}"
+        else:
+            attrs['style'] = style
         return self
     
     def set_event(self, event: str, handler: str):
         """Set JavaScript event handler"""
-        self.attributes[event] = handler
+        self.attributes[sys.intern(event)] = handler
         return self
     
     def on_click(self, handler: str):
@@ -77,29 +194,51 @@ class Element:
         return self.set_event('onmouseover', handler)
 
     def render_attributes(self):
-        """Render HTML attributes"""
-        if not self.attributes:
+        """Render HTML attributes, reusing the last result until the dict is written to"""
+        attrs = self._attributes
+        if attrs is None:
             return ""
-        attr_list = [f'{key}="{value}"' for key, value in self.attributes.items()]
-        return " " + " ".join(attr_list)
+        if attrs.__class__ is not _Attributes:
+            return _join_attributes(attrs) if attrs else ""
+        rendered = attrs.rendered
+        if rendered is None:
+            rendered = attrs.rendered = _join_attributes(attrs)
+        return rendered
+
+    def clone(self):
+        """Return an independent deep copy of the element without a JSON round trip"""
+        return copy.deepcopy(self)
+
+    def render_to(self, parts):
+        """Append this element's HTML to a list of output fragments, for joining once by the caller"""
+        parts.append(self.render())
 
     def render(self):
-        """Render the element as HTML"""
-        attrs = self.render_attributes()
-        if self.content:
-            return f"<{self.tag}{attrs}>{self.content}</{self.tag}>"
-        else:
-            return f"<{self.tag}{attrs}></{self.tag}>"
+        """Render the element as HTML, reusing the last result until its content or attributes change"""
+        html = self._html
+        if html is not None:
+            # Writing to the attribute dict drops its rendered string, so identity shows the HTML is current
+            attrs = self._attributes
+            if attrs is None or (attrs.__class__ is _Attributes and attrs.rendered is self._html_attrs):
+                return html
+        attrs = self._html_attrs = self.render_attributes()
+        tag = self._tag
+        html = self._html = f"<{tag}{attrs}>{self._text or ''}</{tag}>"
+        return html
 
 class Paragraph(Element):
     """Paragraph element"""
     
+    __slots__ = ()
+    
     def __init__(self, text: str, css_class: Optional[str] = None, id_attr: Optional[str] = None):
         super().__init__("p", text, css_class=css_class, id_attr=id_attr)
 
 class HtmlList(Element):
     """List element (ul or ol)"""
     
+    __slots__ = ('items',)
+    
     def __init__(self, items: ListType[str], ordered: bool = False, css_class: Optional[str] = None,
                  id_attr: Optional[str] = None):
         tag = "ol" if ordered else "ul"
@@ -113,13 +252,22 @@ class HtmlList(Element):
 
     def render(self):
         """Render the list as HTML"""
-        items_html = "".join(f"<li>{item}</li>" for item in self.items)
+        if not self.items:
+            items_html = ""
+        else:
+            try:
+                items_html = f"<li>{'</li><li>'.join(self.items)}</li>"
+            except TypeError:
+                # Non-string items (numbers, elements) need converting first
+                items_html = f"<li>{'</li><li>'.join(map(str, self.items))}</li>"
         attrs = self.render_attributes()
         return f"<{self.tag}{attrs}>{items_html}</{self.tag}>"
 
 class Image(Element):
     """Image element"""
     
+    __slots__ = ()
+    
     def __init__(self, src: str, alt: str = "", css_class: Optional[str] = None,
                  id_attr: Optional[str] = None, width: Optional[str] = None, height: Optional[str] = None):
         super().__init__("img", css_class=css_class, id_attr=id_attr)
@@ -138,6 +286,8 @@ class Image(Element):
 class Link(Element):
     """Anchor/Link element"""
     
+    __slots__ = ()
+    
     def __init__(self, text: str, href: str = "#", css_class: Optional[str] = None,
                  id_attr: Optional[str] = None, target: Optional[str] = None):
         super().__init__("a", text, css_class=css_class, id_attr=id_attr)
@@ -145,37 +295,83 @@ class Link(Element):
         if target:
             self.set_attribute("target", target)
 
-class Div(Element):
-    """Div container element"""
+class _ParentElement(Element):
+    """Element that collects child elements through add_content and renders them lazily"""
     
-    def __init__(self, content: str = "", css_class: Optional[str] = None, id_attr: Optional[str] = None):
-        super().__init__("div", content, css_class=css_class, id_attr=id_attr)
+    __slots__ = ('_children',)
+    
+    @property
+    def content(self):
+        """Element content, including the current HTML of any added children"""
+        if not self._children:
+            return self._text
+        parts = [self._text]
+        _emit_items(self._children, parts)
+        return "".join(parts)
+
+    @content.setter
+    def content(self, value):
+        self._text = value
+        self._children = []
 
     def add_content(self, content):
-        """Add content to the div"""
-        if hasattr(content, 'render'):
-            self.content += content.render()
-        else:
-            self.content += str(content)
+        """Add content to the element; elements are rendered when the parent renders"""
+        self._children.append(content if hasattr(content, 'render') else str(content))
+        return self
+
+    def add_many(self, items):
+        """Add several pieces of content to the element at once"""
+        self._children.extend(item if hasattr(item, 'render') else str(item) for item in items)
         return self
 
-class Section(Element):
+    def _write_parts(self, parts):
+        """Append the opening tag, children and closing tag to the output fragments"""
+        tag = self._tag
+        parts.append(f"<{tag}{self.render_attributes()}>")
+        if self._text:
+            parts.append(str(self._text))
+        _emit_items(self._children, parts)
+        parts.append(f"</{tag}>")
+
+    def render_to(self, parts):
+        """Write this element and its children straight into the output fragments"""
+        if type(self).render is not _ParentElement.render:
+            # Subclasses that customise render() must still be honoured when nested
+            parts.append(self.render())
+        else:
+            self._write_parts(parts)
+
+    def render(self):
+        """Render the element and its children in a single pass"""
+        parts = []
+        self._write_parts(parts)
+        return "".join(parts)
+
+class Div(_ParentElement):
+    """Div container element"""
+    
+    __slots__ = ()
+    
+    def __init__(self, content: str = "", css_class: Optional[str] = None, id_attr: Optional[str] = None):
+        super().__init__("div", content, css_class=css_class, id_attr=id_attr)
+
+class Section(_ParentElement):
     """Section element"""
     
+    __slots__ = ()
+    
     def __init__(self, content: str = "", css_class: Optional[str] = None, id_attr: Optional[str] = None):
         super().__init__("section", content, css_class=css_class, id_attr=id_attr)
 
-    def add_content(self, content):
-        """Add content to the section"""
-        if hasattr(content, 'render'):
-            self.content += content.render()
-        else:
-            self.content += str(content)
-        return self
+_CARD_BODY_HTML = '<div class="card-body">{}{}</div>'
+_CARD_TITLE_HTML = '<h5 class="card-title">{}</h5>'
+_CARD_TEXT_HTML = '<p class="card-text">{}</p>'
 
 class Card(Element):
     """Bootstrap card component"""
     
+    __slots__ = ('title', 'body')
+    
     def __init__(self, title: str = "", body: str = "", css_class: Optional[str] = None,
                  id_attr: Optional[str] = None):
         self.title = title
@@ -187,33 +383,20 @@ class Card(Element):
 
     def render(self):
         """Render the card as HTML"""
-        title_html = f'<h5 class="card-title">{self.title}</h5>' if self.title else ""
-        body_html = f'<p class="card-text">{self.body}</p>' if self.body else ""
-        
-        content = f"""
-        <div class="card-body">
-            {title_html}
-            {body_html}
-        </div>
-        """
-        
-        attrs = self.render_attributes()
-        return f"<{self.tag}{attrs}>{content}</{self.tag}>"
+        content = _CARD_BODY_HTML.format(
+            _CARD_TITLE_HTML.format(self.title) if self.title else "",
+            _CARD_TEXT_HTML.format(self.body) if self.body else "",
+        )
+        return f"<{self.tag}{self.render_attributes()}>{content}</{self.tag}>"
 
-class Container(Element):
+class Container(_ParentElement):
     """Bootstrap container"""
     
+    __slots__ = ()
+    
     def __init__(self, content: str = "", fluid: bool = False, css_class: Optional[str] = None,
                  id_attr: Optional[str] = None):
         container_class = "container-fluid" if fluid else "container"
         if css_class:
             container_class += f" {css_class}"
         super().__init__("div", content, css_class=container_class, id_attr=id_attr)
-
-    def add_content(self, content):
-        """Add content to the container"""
-        if hasattr(content, 'render'):
-            self.content += content.render()
-        else:
-            self.content += str(content)
-        return self
@@ -1,30 +1,131 @@
 """
 Export functionality for HTML generator - PDF and JSON support
 """
+import functools
 import json
-from typing import Dict, Any, Optional, List, Union
-from .elements import Element
+import re
+from importlib.util import find_spec
+from typing import Dict, Any, Optional, List, Union, BinaryIO
+from .elements import Element, Container, Div, Paragraph
 from .page import Page
+from .forms import Form, Input, Button, TextArea, Select
+from .layout import Row, Column, Flex
+from .components import Alert, Badge, ProgressBar, Accordion, Modal
+
+# orjson is optional; the stdlib json module is used when it is missing
+_HAS_ORJSON = find_spec("orjson") is not None
+orjson = None
+
+def _load_orjson():
+    """Import orjson on first use so that plain HTML rendering never loads it"""
+    global orjson
+    if orjson is None and _HAS_ORJSON:
+        import orjson as module
+        orjson = module
+    return orjson
+
+# msgpack is optional too; it backs the binary to_msgpack / from_msgpack format
+_HAS_MSGPACK = find_spec("msgpack") is not None
+msgpack = None
+
+def _load_msgpack():
+    """Import msgpack on first use, failing clearly when it isn't installed"""
+    global msgpack
+    if msgpack is None:
+        if not _HAS_MSGPACK:
+            raise ImportError("msgpack is not installed. Install msgpack to use binary serialization.")
+        import msgpack as module
+        msgpack = module
+    return msgpack
+
+@functools.lru_cache(maxsize=1)
+def _probe_pdf():
+    """Find an installed PDF library once, without importing it"""
+    if find_spec("weasyprint") is not None:
+        return True, "weasyprint"
+    if find_spec("pdfkit") is not None:
+        return True, "pdfkit"
+    return False, None
+
+# Marks an attribute that an object doesn't have
+_MISSING = object()
+
+# Whether instances of a type have a render method, looked up once per type
+_RENDERABLE_TYPES = {}
+
+def _renders(item) -> bool:
+    """Return True if item can render itself as HTML"""
+    cls = type(item)
+    renders = _RENDERABLE_TYPES.get(cls)
+    if renders is None:
+        renders = _RENDERABLE_TYPES[cls] = hasattr(cls, 'render')
+    return renders
+
+# Optional attributes copied by _element_to_dict; child lists say whether every item is an element
+_SCALAR_ATTRS = ('css_class', 'id_attr', 'style')
+_CHILD_LIST_ATTRS = (('child_elements', False), ('fields', True), ('columns', True))
+
+@functools.lru_cache(maxsize=None)
+def _serializer_plan(cls):
+    """Work out once per element class which attributes _element_to_dict needs to read"""
+    # Instances with a __dict__ may carry any attribute; fully slotted ones only what the class declares
+    has_dict = bool(cls.__dictoffset__)
+    
+    # Fixed keys first, so every dict keeps the same key order
+    header = {'type': 'Element', 'class_name': cls.__name__, 'tag': None,
+              'css_class': None, 'id_attr': None, 'style': None, 'attributes': None}
+    scalars = tuple(name for name in _SCALAR_ATTRS if has_dict or hasattr(cls, name))
+    child_lists = tuple(entry for entry in _CHILD_LIST_ATTRS if has_dict or hasattr(cls, entry[0]))
+    return header, scalars, has_dict or hasattr(cls, 'content'), child_lists
+
+# Bootstrap stylesheet links; PDFs don't need the framework, and WeasyPrint would fetch and parse it on every export
+_PDF_STRIP_RE = re.compile(r'<link[^>]+href="[^"]*bootstrap[^"]*"[^>]*>')
+
+# Element classes that from_dict can rebuild by name from the fields to_dict records.
+# Anything else, including classes with extra state such as Input labels, Select options,
+# Accordion items, Card, HtmlList, Table and non-Element content like Heading, is exported as
+# its rendered HTML instead.
+_ELEMENT_CLASSES = {
+    'Element': Element,
+    'Container': Container,
+    'Div': Div,
+    'Paragraph': Paragraph,
+    'Form': Form,
+    'Button': Button,
+    'Row': Row,
+    'Column': Column,
+    'Flex': Flex,
+    'Alert': Alert,
+    'Badge': Badge,
+    'ProgressBar': ProgressBar,
+    'Modal': Modal
+}
+
+def _rebuildable(item) -> bool:
+    """Whether from_dict can rebuild item field by field"""
+    cls = type(item)
+    return _ELEMENT_CLASSES.get(cls.__name__) is cls
+
+def _raw_dict(item) -> Dict[str, Any]:
+    """Describe content that can't be rebuilt field by field by its rendered HTML"""
+    return {'type': 'Element', 'class_name': type(item).__name__, 'html': item.render()}
+
+class _RawHTML(Element):
+    """Markup restored from its rendered form; renders exactly as it was exported"""
+    
+    __slots__ = ()
+    
+    def render(self):
+        return self._text
 
 class ExportManager:
     """Manager for exporting HTML generator content to various formats"""
     
     def __init__(self):
-        self.pdf_available = False
         self.json_available = True
         
-        # Try to import PDF libraries
-        try:
-            import weasyprint
-            self.pdf_library = "weasyprint"
-            self.pdf_available = True
-        except ImportError:
-            try:
-                import pdfkit
-                self.pdf_library = "pdfkit"
-                self.pdf_available = True
-            except ImportError:
-                self.pdf_library = None
+        # PDF libraries are looked up once per process and imported on first export
+        self.pdf_available, self.pdf_library = _probe_pdf()
 
     def to_dict(self, element: Union[Element, Page]) -> Dict[str, Any]:
         """Convert element to dictionary representation"""
@@ -44,16 +145,42 @@ class ExportManager:
     
     def to_json(self, element: Union[Element, Page], indent: int = 2) -> str:
         """Convert element to JSON string"""
-        return json.dumps(self.to_dict(element), indent=indent)
+        if _load_orjson() is not None and indent in (None, 0, 2):
+            return self.to_json_bytes(element, indent).decode('utf-8')
+        return json.dumps(self.to_dict(element), indent=indent, default=self._json_default)
     
-    def from_json(self, json_str: str) -> Union[Element, Page]:
+    def to_json_bytes(self, element: Union[Element, Page], indent: int = 2) -> bytes:
+        """Convert element to UTF-8 encoded JSON, ready to write to a binary file"""
+        data = self.to_dict(element)
+        if _load_orjson() is not None and indent in (None, 0, 2):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(data, default=self._json_default, option=option)
+        return json.dumps(data, indent=indent, default=self._json_default).encode('utf-8')
+    
+    def from_json(self, json_str: Union[str, bytes]) -> Union[Element, Page]:
         """Create element from JSON string"""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str) if _load_orjson() is not None else json.loads(json_str)
         return self.from_dict(data)
     
-    def to_pdf(self, html_content: str, output_path: str, 
+    def to_msgpack(self, element: Union[Element, Page]) -> bytes:
+        """Convert element to compact MessagePack bytes"""
+        return _load_msgpack().packb(self.to_dict(element), use_bin_type=True, default=self._json_default)
+    
+    def from_msgpack(self, data: bytes) -> Union[Element, Page]:
+        """Create element from MessagePack bytes"""
+        return self.from_dict(_load_msgpack().unpackb(data, raw=False))
+    
+    def _json_default(self, obj):
+        """Serialize elements nested in attribute values"""
+        if isinstance(obj, (Element, Page)):
+            return self.to_dict(obj)
+        raise TypeError(f"Cannot serialize object of type {type(obj)}")
+    
+    def to_pdf(self, html_content: str, output_path: Union[str, BinaryIO], 
                options: Optional[Dict[str, Any]] = None) -> bool:
-        """Export HTML to PDF"""
+        """Export HTML to PDF, written to a file path or an open binary file object"""
         if not self.pdf_available:
             raise ImportError("No PDF library available. Install weasyprint or pdfkit.")
         
@@ -68,6 +195,34 @@ class ExportManager:
         
         return False
     
+    def to_pdf_batch(self, html_contents: List[str], output_path: Union[str, BinaryIO],
+                     options: Optional[Dict[str, Any]] = None) -> bool:
+        """Export several HTML documents into a single PDF in one WeasyPrint pass"""
+        if not self.pdf_available:
+            raise ImportError("No PDF library available. Install weasyprint or pdfkit.")
+        
+        if self.pdf_library != "weasyprint":
+            print("Batch PDF export requires weasyprint.")
+            return False
+        
+        try:
+            import weasyprint
+            
+            # Render every document, then write all their pages out together
+            documents = [
+                weasyprint.HTML(string=self._strip_pdf_css(html_content, options)).render()
+                for html_content in html_contents
+            ]
+            if not documents:
+                return False
+            all_pages = [page for document in documents for page in document.pages]
+            documents[0].copy(all_pages).write_pdf(target=output_path)
+            return True
+            
+        except Exception as e:
+            print(f"WeasyPrint batch export failed: {e}")
+            return False
+    
     def _page_to_dict(self, page: Page) -> Dict[str, Any]:
         """Convert Page to dictionary"""
         return {
@@ -76,7 +231,8 @@ class ExportManager:
             'header_text': page.header_text,
             'logo_url': getattr(page, 'logo_url', None),
             'theme': getattr(page, 'current_theme', 'bootstrap'),
-            'content': [self._element_to_dict(elem) for elem in page.content],
+            'content': [item if isinstance(item, str) else self._element_to_dict(item)
+                        for item in page.body_content],
             'custom_css': getattr(page, 'custom_css', []),
             'custom_js': getattr(page, 'custom_js', []),
             'meta_tags': getattr(page, 'meta_tags', {}),
@@ -84,43 +240,74 @@ class ExportManager:
         }
     
     def _element_to_dict(self, element: Element) -> Dict[str, Any]:
-        """Convert Element to dictionary"""
-        data = {
-            'type': 'Element',
-            'class_name': element.__class__.__name__,
-            'tag': element.tag,
-            'css_class': element.css_class,
-            'id_attr': element.id_attr,
-            'style': element.style,
-            'attributes': getattr(element, 'attributes', {})
-        }
+        """Convert Element to dictionary, walking nested elements with an explicit stack"""
+        if not _rebuildable(element):
+            return _raw_dict(element)
+        root = {}
+        # Each entry pairs an element with the (still empty) dict that will describe it
+        stack = [(element, root)]
+        # Elements reached more than once (shared subtrees) map to a single dict
+        memo = {id(element): root}
         
-        # Handle content
-        if hasattr(element, 'content'):
-            if isinstance(element.content, list):
-                data['content'] = [
-                    self._element_to_dict(item) if hasattr(item, 'render') else str(item)
-                    for item in element.content
-                ]
-            elif hasattr(element.content, 'render'):
-                data['content'] = self._element_to_dict(element.content)
-            else:
-                data['content'] = str(element.content)
+        child_dicts = self._child_dicts
+        reserve_dict = self._reserve_dict
         
-        # Handle child elements
-        if hasattr(element, 'child_elements'):
-            data['child_elements'] = [
-                self._element_to_dict(child) if hasattr(child, 'render') else str(child)
-                for child in element.child_elements
-            ]
-        
-        # Handle special element properties
-        if hasattr(element, 'fields'):  # Form elements
-            data['fields'] = [self._element_to_dict(field) for field in element.fields]
-        
-        if hasattr(element, 'columns'):  # Row elements
-            data['columns'] = [self._element_to_dict(col) for col in element.columns]
+        while stack:
+            node, data = stack.pop()
+            header, scalars, has_content, child_lists = _serializer_plan(type(node))
+            data.update(header)
+            data['tag'] = node.tag
+            for name in scalars:
+                data[name] = getattr(node, name, None)
+            data['attributes'] = getattr(node, 'attributes', {})
+            
+            # Handle content; a single lookup, since content may be a computed property
+            if has_content:
+                content = getattr(node, 'content', _MISSING)
+                if content.__class__ is str:
+                    data['content'] = content
+                elif content is _MISSING:
+                    pass
+                elif isinstance(content, list):
+                    data['content'] = child_dicts(content, stack, memo)
+                elif _renders(content):
+                    data['content'] = reserve_dict(content, stack, memo)
+                else:
+                    data['content'] = str(content)
+            
+            # Handle child elements and special list properties (Form fields, Row columns)
+            for name, elements_only in child_lists:
+                items = getattr(node, name, None)
+                if items is not None:
+                    data[name] = child_dicts(items, stack, memo, elements_only)
         
+        return root
+    
+    def _child_dicts(self, items, stack, memo, elements_only: bool = False) -> List[Any]:
+        """Reserve a dict per child element, queueing it on stack; other items become strings"""
+        result = []
+        append = result.append
+        for item in items:
+            if _rebuildable(item):
+                data = memo.get(id(item))
+                if data is None:
+                    data = memo[id(item)] = {}
+                    stack.append((item, data))
+                append(data)
+            elif elements_only or _renders(item):
+                append(_raw_dict(item))
+            else:
+                append(str(item))
+        return result
+    
+    def _reserve_dict(self, element, stack, memo) -> Dict[str, Any]:
+        """Return the dict describing element, queueing it for filling the first time it is seen"""
+        if not _rebuildable(element):
+            return _raw_dict(element)
+        data = memo.get(id(element))
+        if data is None:
+            data = memo[id(element)] = {}
+            stack.append((element, data))
         return data
     
     def _dict_to_page(self, data: Dict[str, Any]) -> Page:
@@ -141,12 +328,14 @@ class ExportManager:
             else:
                 page.add_content(str(content_data))
         
-        # Add custom CSS and JS
-        for css in data.get('custom_css', []):
-            page.add_css(css)
+        # Restore custom CSS and JS; _page_to_dict stores them as strings or None
+        custom_css = data.get('custom_css')
+        if custom_css:
+            page.custom_css = custom_css if isinstance(custom_css, str) else "\n".join(custom_css)
         
-        for js in data.get('custom_js', []):
-            page.add_js(js)
+        custom_js = data.get('custom_js')
+        if custom_js:
+            page.custom_js = custom_js if isinstance(custom_js, str) else "\n".join(custom_js)
         
         # Add meta tags
         for name, content in data.get('meta_tags', {}).items():
@@ -155,75 +344,91 @@ class ExportManager:
         return page
     
     def _dict_to_element(self, data: Dict[str, Any]) -> Element:
-        """Create Element from dictionary"""
-        from .elements import Element, Container, Div, Paragraph
-        from .forms import Form, Input, Button, TextArea, Select
-        from .layout import Row, Column, Flex
-        from .components import Alert, Badge, ProgressBar, Accordion, Modal
-        
-        class_name = data.get('class_name', 'Element')
-        
-        # Map class names to actual classes
-        class_map = {
-            'Element': Element,
-            'Container': Container,
-            'Div': Div,
-            'Paragraph': Paragraph,
-            'Form': Form,
-            'Input': Input,
-            'Button': Button,
-            'TextArea': TextArea,
-            'Select': Select,
-            'Row': Row,
-            'Column': Column,
-            'Flex': Flex,
-            'Alert': Alert,
-            'Badge': Badge,
-            'ProgressBar': ProgressBar,
-            'Accordion': Accordion,
-            'Modal': Modal
-        }
-        
-        ElementClass = class_map.get(class_name, Element)
+        """Create Element from dictionary, building nested elements with an explicit stack"""
+        root = [None]
+        # Each entry is a dict to build and where to put the result: (list, index) or (element, attribute)
+        stack = [(data, root, 0)]
+        # Dicts that occur more than once (shared subtrees) are rebuilt as one shared element
+        built = {}
         
-        # Create basic element
-        element = ElementClass.__new__(ElementClass)
-        element.tag = data.get('tag', 'div')
-        element.css_class = data.get('css_class')
-        element.id_attr = data.get('id_attr')
-        element.style = data.get('style')
-        element.attributes = data.get('attributes', {})
+        while stack:
+            node_data, target, key = stack.pop()
+            element = built.get(id(node_data))
+            if element is not None:
+                self._place(element, target, key)
+                continue
+            
+            if 'html' in node_data:
+                # Exported as rendered markup; restore it verbatim
+                element = built[id(node_data)] = _RawHTML('div', node_data['html'])
+                self._place(element, target, key)
+                continue
+            
+            element_class = _ELEMENT_CLASSES.get(node_data.get('class_name', 'Element'), Element)
+            
+            # Create basic element
+            element = built[id(node_data)] = element_class.__new__(element_class)
+            element.tag = node_data.get('tag', 'div')
+            element.attributes = node_data.get('attributes', {})
+            for name in ('css_class', 'id_attr', 'style'):
+                try:
+                    setattr(element, name, node_data.get(name))
+                except AttributeError:
+                    # Slotted elements only keep these inside attributes
+                    pass
+            
+            # Handle content
+            if 'content' in node_data:
+                content = node_data['content']
+                if isinstance(content, list):
+                    element.content = self._child_slots(content, stack)
+                elif isinstance(content, dict):
+                    stack.append((content, element, 'content'))
+                else:
+                    element.content = str(content)
+            
+            # Handle child elements
+            if 'child_elements' in node_data:
+                element.child_elements = self._child_slots(node_data['child_elements'], stack)
+            
+            # Handle special properties
+            if 'fields' in node_data:
+                element.fields = self._child_slots(node_data['fields'], stack)
+            
+            if 'columns' in node_data:
+                element.columns = self._child_slots(node_data['columns'], stack)
+            
+            self._place(element, target, key)
         
-        # Handle content
-        if 'content' in data:
-            content = data['content']
-            if isinstance(content, list):
-                element.content = [
-                    self._dict_to_element(item) if isinstance(item, dict) else str(item)
-                    for item in content
-                ]
-            elif isinstance(content, dict):
-                element.content = self._dict_to_element(content)
+        return root[0]
+    
+    def _place(self, element, target, key):
+        """Store a rebuilt element in its list slot or parent attribute"""
+        if isinstance(target, list):
+            target[key] = element
+        else:
+            setattr(target, key, element)
+    
+    def _child_slots(self, items, stack) -> List[Any]:
+        """Reserve a list slot per child dict, queueing it on stack; other items become strings"""
+        result = []
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                result.append(None)
+                stack.append((item, result, index))
             else:
-                element.content = str(content)
-        
-        # Handle child elements
-        if 'child_elements' in data:
-            element.child_elements = [
-                self._dict_to_element(child) if isinstance(child, dict) else str(child)
-                for child in data['child_elements']
-            ]
-        
-        # Handle special properties
-        if 'fields' in data:
-            element.fields = [self._dict_to_element(field) for field in data['fields']]
-        
-        if 'columns' in data:
-            element.columns = [self._dict_to_element(col) for col in data['columns']]
-        
-        return element
+                result.append(str(item))
+        return result
     
-    def _export_with_weasyprint(self, html_content: str, output_path: str, 
+    def _strip_pdf_css(self, html_content: str, options: Optional[Dict[str, Any]] = None) -> str:
+        """Drop stylesheet links the PDF doesn't use before WeasyPrint downloads them"""
+        html_content = _PDF_STRIP_RE.sub('', html_content)
+        if options:
+            for pattern in options.get('strip_css_patterns', ()):
+                html_content = re.sub(pattern, '', html_content)
+        return html_content
+    
+    def _export_with_weasyprint(self, html_content: str, output_path: Union[str, BinaryIO], 
                                options: Optional[Dict[str, Any]] = None) -> bool:
         """Export using WeasyPrint"""
         try:
@@ -238,17 +443,17 @@ class ExportManager:
                 default_options.update(options)
             
             # Create HTML document
-            html_doc = weasyprint.HTML(string=html_content)
+            html_doc = weasyprint.HTML(string=self._strip_pdf_css(html_content, default_options))
             
-            # Generate PDF
-            html_doc.write_pdf(output_path)
+            # Generate PDF; WeasyPrint writes straight into a path or file object
+            html_doc.write_pdf(target=output_path)
             return True
             
         except Exception as e:
             print(f"WeasyPrint export failed: {e}")
             return False
     
-    def _export_with_pdfkit(self, html_content: str, output_path: str, 
+    def _export_with_pdfkit(self, html_content: str, output_path: Union[str, BinaryIO], 
                            options: Optional[Dict[str, Any]] = None) -> bool:
         """Export using pdfkit"""
         try:
@@ -267,8 +472,15 @@ class ExportManager:
             if options:
                 default_options.update(options)
             
-            # Generate PDF
-            pdfkit.from_string(html_content, output_path, options=default_options)
+            # strip_css_patterns is ours, not a wkhtmltopdf flag
+            for pattern in default_options.pop('strip_css_patterns', ()):
+                html_content = re.sub(pattern, '', html_content)
+            
+            # Generate PDF; pdfkit only writes to paths, so file objects get the bytes
+            if hasattr(output_path, 'write'):
+                output_path.write(pdfkit.from_string(html_content, False, options=default_options))
+            else:
+                pdfkit.from_string(html_content, output_path, options=default_options)
             return True
             
         except Exception as e:
@@ -280,25 +492,34 @@ class SerializableMixin:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert this component to dictionary"""
-        export_manager = ExportManager()
         return export_manager.to_dict(self)
     
     def to_json(self, indent: int = 2) -> str:
         """Convert this component to JSON"""
-        export_manager = ExportManager()
         return export_manager.to_json(self, indent)
     
+    def to_json_bytes(self, indent: int = 2) -> bytes:
+        """Convert this component to UTF-8 encoded JSON"""
+        return export_manager.to_json_bytes(self, indent)
+    
+    def to_msgpack(self) -> bytes:
+        """Convert this component to MessagePack bytes"""
+        return export_manager.to_msgpack(self)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
         """Create component from dictionary"""
-        export_manager = ExportManager()
         return export_manager.from_dict(data)
     
     @classmethod
-    def from_json(cls, json_str: str):
-        """Create component from JSON"""
-        export_manager = ExportManager()
+    def from_json(cls, json_str: Union[str, bytes]):
+        """Create component from JSON text or UTF-8 bytes"""
         return export_manager.from_json(json_str)
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes):
+        """Create component from MessagePack bytes"""
+        return export_manager.from_msgpack(data)
 
 # Global export manager instance
 export_manager = ExportManager()
@@ -315,15 +536,32 @@ def to_json(element: Union[Element, Page], indent: int = 2) -> str:
     """Convert element to JSON"""
     return export_manager.to_json(element, indent)
 
-def from_json(json_str: str) -> Union[Element, Page]:
+def to_json_bytes(element: Union[Element, Page], indent: int = 2) -> bytes:
+    """Convert element to UTF-8 encoded JSON"""
+    return export_manager.to_json_bytes(element, indent)
+
+def from_json(json_str: Union[str, bytes]) -> Union[Element, Page]:
     """Create element from JSON"""
     return export_manager.from_json(json_str)
 
-def to_pdf(html_content: str, output_path: str, 
+def to_msgpack(element: Union[Element, Page]) -> bytes:
+    """Convert element to MessagePack bytes"""
+    return export_manager.to_msgpack(element)
+
+def from_msgpack(data: bytes) -> Union[Element, Page]:
+    """Create element from MessagePack bytes"""
+    return export_manager.from_msgpack(data)
+
+def to_pdf(html_content: str, output_path: Union[str, BinaryIO], 
            options: Optional[Dict[str, Any]] = None) -> bool:
     """Export HTML to PDF"""
     return export_manager.to_pdf(html_content, output_path, options)
 
+def to_pdf_batch(html_contents: List[str], output_path: Union[str, BinaryIO],
+                 options: Optional[Dict[str, Any]] = None) -> bool:
+    """Export several HTML documents into a single PDF"""
+    return export_manager.to_pdf_batch(html_contents, output_path, options)
+
 def check_pdf_support() -> Dict[str, Any]:
     """Check which PDF libraries are available"""
     info = {
@@ -332,19 +570,13 @@ def check_pdf_support() -> Dict[str, Any]:
         'recommended': None
     }
     
-    try:
-        import weasyprint
+    if find_spec('weasyprint') is not None:
         info['weasyprint'] = True
         info['recommended'] = 'weasyprint'
-    except ImportError:
-        pass
     
-    try:
-        import pdfkit
+    if find_spec('pdfkit') is not None:
         info['pdfkit'] = True
         if not info['recommended']:
             info['recommended'] = 'pdfkit'
-    except ImportError:
-        pass
     
     return info
\ No newline at end of file
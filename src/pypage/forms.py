@@ -101,10 +101,10 @@ class Select(Element):
 
     def render(self):
         """Render the select with options"""
-        options_html = ""
-        for option in self.options:
-            selected_attr = ' selected' if option.get('selected', False) else ''
-            options_html += f'<option value="{option["value"]}"{selected_attr}>{option["text"]}</option>\n'
+        options_html = "".join(
+            f'<option value="{option["value"]}"{" selected" if option.get("selected", False) else ""}>{option["text"]}</option>\n'
+            for option in self.options
+        )
         
         select_html = f"<{self.tag}{self.render_attributes()}>\n{options_html}</{self.tag}>"
         
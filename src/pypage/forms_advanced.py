@@ -1,9 +1,20 @@
 """
 Advanced form components with enhanced validation and UX
 """
-from typing import Optional, List, Dict, Any, Union
+import re
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Union, NamedTuple
 from .elements import Element
-from .components import ComponentBase
+from .components import ComponentBase, _as_record
+
+# HTML input type for each DateTimePicker picker_type
+_PICKER_INPUT_TYPES = MappingProxyType({
+    'date': 'date',
+    'time': 'time',
+    'datetime': 'datetime-local',
+    'month': 'month',
+    'week': 'week'
+})
 
 class FileUpload(ComponentBase):
     """Advanced file upload component with drag & drop"""
@@ -244,13 +255,7 @@ class DateTimePicker(ComponentBase):
         self.picker_id = f"picker-{str(uuid.uuid4())[:8]}"
         
         # Determine input type and attributes
-        input_type = {
-            'date': 'date',
-            'time': 'time',
-            'datetime': 'datetime-local',
-            'month': 'month',
-            'week': 'week'
-        }.get(picker_type, 'datetime-local')
+        input_type = _PICKER_INPUT_TYPES.get(picker_type, 'datetime-local')
         
         picker_html = f'''
         <div class="input-group">
@@ -269,70 +274,76 @@ class DateTimePicker(ComponentBase):
         
         self.content = picker_html
 
+class WizardStep(NamedTuple):
+    """A single FormWizard step"""
+    title: Optional[str] = None
+    content: Any = ''
+
 class FormWizard(ComponentBase):
     """Multi-step form wizard component"""
     
-    def __init__(self, steps: List[Dict[str, Any]], css_class: Optional[str] = None):
+    def __init__(self, steps: List[Union[WizardStep, Dict[str, Any]]], css_class: Optional[str] = None):
         wizard_class = "form-wizard-container"
         if css_class:
             wizard_class += f" {css_class}"
         
         super().__init__(css_class=wizard_class)
+        self.steps = steps = tuple(_as_record(WizardStep, step) for step in steps)
         
         # Generate unique ID
         import uuid
         self.wizard_id = f"wizard-{str(uuid.uuid4())[:8]}"
         
         # Build wizard HTML
-        wizard_html = f'<div class="wizard-wrapper" id="{self.wizard_id}">'
+        parts = [f'<div class="wizard-wrapper" id="{self.wizard_id}">']
         
         # Step indicator
-        wizard_html += '<div class="wizard-steps">'
+        parts.append('<div class="wizard-steps">')
         for i, step in enumerate(steps):
             step_class = "wizard-step"
             if i == 0:
                 step_class += " active"
             
-            wizard_html += f'''
+            parts.append(f'''
             <div class="{step_class}" data-step="{i}">
                 <div class="step-number">{i + 1}</div>
-                <div class="step-title">{step.get('title', f'Step {i + 1}')}</div>
+                <div class="step-title">{step.title if step.title is not None else f'Step {i + 1}'}</div>
             </div>
-            '''
-        wizard_html += '</div>'
+            ''')
+        parts.append('</div>')
         
         # Step content
-        wizard_html += '<div class="wizard-content">'
+        parts.append('<div class="wizard-content">')
         for i, step in enumerate(steps):
             step_class = "wizard-panel"
             if i == 0:
                 step_class += " active"
             
-            content = step.get('content', '')
+            content = step.content
             if hasattr(content, 'render'):
                 content = content.render()
             elif isinstance(content, list):
                 content = ''.join([item.render() if hasattr(item, 'render') else str(item) for item in content])
             
-            wizard_html += f'''
+            parts.append(f'''
             <div class="{step_class}" data-panel="{i}">
-                <h4>{step.get('title', f'Step {i + 1}')}</h4>
+                <h4>{step.title if step.title is not None else f'Step {i + 1}'}</h4>
                 {content}
             </div>
-            '''
-        wizard_html += '</div>'
+            ''')
+        parts.append('</div>')
         
         # Navigation buttons
-        wizard_html += '''
+        parts.append('''
         <div class="wizard-navigation">
             <button type="button" class="btn btn-secondary wizard-prev" disabled>Previous</button>
             <button type="button" class="btn btn-primary wizard-next">Next</button>
             <button type="submit" class="btn btn-success wizard-submit" style="display: none;">Submit</button>
         </div>
-        '''
+        ''')
         
-        wizard_html += '</div>'
-        self.content = wizard_html
+        parts.append('</div>')
+        self.content = ''.join(parts)
     
     def render(self):
         attrs = self.render_attributes()
@@ -505,9 +516,28 @@ class FormValidation(ComponentBase):
         self.form_id = form_id
         self.rules = rules
         
+        # Serialize the rules once, not on every render. Patterns are
+        # JavaScript regexes, so they are only compiled for server-side checks.
+        self._patterns = {}
+        self._rules_js = self._dict_to_js(rules)
+        
         # This component only provides JavaScript validation
         self.content = ""
     
+    def matches_pattern(self, field_name: str, value: str) -> bool:
+        """Check a value against the field's pattern on the server side"""
+        try:
+            pattern = self._patterns[field_name]
+        except KeyError:
+            source = self.rules.get(field_name, {}).get('pattern')
+            try:
+                pattern = re.compile(source) if source else None
+            except re.error:
+                # JS-only syntax; leave the check to the browser
+                pattern = None
+            self._patterns[field_name] = pattern
+        return pattern is None or pattern.search(value) is not None
+    
     def render(self):
         validation_js = f'''
         <script>
@@ -515,7 +545,7 @@ class FormValidation(ComponentBase):
             const form = document.getElementById('{self.form_id}');
             if (!form) return;
             
-            const rules = {self._dict_to_js(self.rules)};
+            const rules = {self._rules_js};
             
             // Add validation styles
             const style = document.createElement('style');
@@ -718,26 +748,26 @@ class SearchableSelect(ComponentBase):
         self.multiple = multiple
     
     def _render_options(self, options, multiple):
-        options_html = ""
+        parts = []
         for option in options:
             value = option.get('value', '')
             text = option.get('text', value)
             
-            options_html += f'''
+            parts.append(f'''
             <div class="select-option" data-value="{value}">
                 {f'<input type="checkbox" class="option-checkbox">' if multiple else ''}
                 <span class="option-text">{text}</span>
             </div>
-            '''
-        return options_html
+            ''')
+        return ''.join(parts)
     
     def _render_select_options(self, options):
-        options_html = ""
+        parts = []
         for option in options:
             value = option.get('value', '')
             text = option.get('text', value)
-            options_html += f'<option value="{value}">{text}</option>'
-        return options_html
+            parts.append(f'<option value="{value}">{text}</option>')
+        return ''.join(parts)
     
     def render(self):
         attrs = self.render_attributes()
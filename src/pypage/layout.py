@@ -1,9 +1,12 @@
+import sys
 from typing import List as ListType, Union, Optional
-from .elements import Element
+from .elements import _ParentElement
 
-class Row(Element):
+class Row(_ParentElement):
     """Bootstrap row component for grid layout"""
     
+    __slots__ = ()
+    
     def __init__(self, content: Union[str, ListType] = "", css_class: Optional[str] = None,
                  id_attr: Optional[str] = None):
         row_class = "row"
@@ -12,26 +15,19 @@ class Row(Element):
         super().__init__("div", css_class=row_class, id_attr=id_attr)
         
         if isinstance(content, list):
-            self.content = ""
-            for item in content:
-                if hasattr(item, 'render'):
-                    self.content += item.render()
-                else:
-                    self.content += str(item)
+            self.add_many(content)
         else:
             self.content = str(content)
 
-    def add_column(self, column):
-        """Add a column to the row"""
-        if hasattr(column, 'render'):
-            self.content += column.render()
-        else:
-            self.content += str(column)
-        return self
+    def add_column(self, *columns):
+        """Add one or more columns to the row"""
+        return self.add_many(columns)
 
-class Column(Element):
+class Column(_ParentElement):
     """Bootstrap column component for grid layout"""
     
+    __slots__ = ()
+    
     def __init__(self, content: Union[str, ListType] = "", width: Optional[Union[str, int]] = None,
                  css_class: Optional[str] = None, id_attr: Optional[str] = None):
         # Determine column class based on width
@@ -45,91 +41,68 @@ class Column(Element):
         if css_class:
             col_class += f" {css_class}"
         
-        super().__init__("div", css_class=col_class, id_attr=id_attr)
+        # Grids repeat the same few column classes; share one string per class
+        super().__init__("div", css_class=sys.intern(col_class), id_attr=id_attr)
         
         if isinstance(content, list):
-            self.content = ""
-            for item in content:
-                if hasattr(item, 'render'):
-                    self.content += item.render()
-                else:
-                    self.content += str(item)
+            self.add_many(content)
         else:
             self.content = str(content)
 
-    def add_content(self, content):
-        """Add content to the column"""
-        if hasattr(content, 'render'):
-            self.content += content.render()
-        else:
-            self.content += str(content)
-        return self
+    def add_content(self, *contents):
+        """Add one or more pieces of content to the column"""
+        return self.add_many(contents)
 
-class Flex(Element):
+# Bootstrap classes for each Flex option; unknown values add no class
+_FLEX_DIRECTION_CLASSES = {
+    "column": "flex-column",
+    "row-reverse": "flex-row-reverse",
+    "column-reverse": "flex-column-reverse",
+}
+
+_FLEX_JUSTIFY_CLASSES = {
+    "start": "justify-content-start",
+    "end": "justify-content-end",
+    "center": "justify-content-center",
+    "between": "justify-content-between",
+    "around": "justify-content-around",
+    "evenly": "justify-content-evenly",
+}
+
+_FLEX_ALIGN_CLASSES = {
+    "start": "align-items-start",
+    "end": "align-items-end",
+    "center": "align-items-center",
+    "baseline": "align-items-baseline",
+    "stretch": "align-items-stretch",
+}
+
+class Flex(_ParentElement):
     """Flexbox container component"""
     
+    __slots__ = ()
+    
     def __init__(self, content: Union[str, ListType] = "", direction: str = "row",
                  justify: Optional[str] = None, align: Optional[str] = None,
                  wrap: bool = False, css_class: Optional[str] = None,
                  id_attr: Optional[str] = None):
-        flex_class = "d-flex"
-        
-        # Direction
-        if direction == "column":
-            flex_class += " flex-column"
-        elif direction == "row-reverse":
-            flex_class += " flex-row-reverse"
-        elif direction == "column-reverse":
-            flex_class += " flex-column-reverse"
-        
-        # Justify content
-        if justify:
-            justify_class_map = {
-                "start": "justify-content-start",
-                "end": "justify-content-end",
-                "center": "justify-content-center",
-                "between": "justify-content-between",
-                "around": "justify-content-around",
-                "evenly": "justify-content-evenly"
-            }
-            if justify in justify_class_map:
-                flex_class += f" {justify_class_map[justify]}"
-        
-        # Align items
-        if align:
-            align_class_map = {
-                "start": "align-items-start",
-                "end": "align-items-end",
-                "center": "align-items-center",
-                "baseline": "align-items-baseline",
-                "stretch": "align-items-stretch"
-            }
-            if align in align_class_map:
-                flex_class += f" {align_class_map[align]}"
-        
-        # Wrap
-        if wrap:
-            flex_class += " flex-wrap"
-        
-        if css_class:
-            flex_class += f" {css_class}"
+        classes = [
+            "d-flex",
+            _FLEX_DIRECTION_CLASSES.get(direction),
+            _FLEX_JUSTIFY_CLASSES.get(justify),
+            _FLEX_ALIGN_CLASSES.get(align),
+            "flex-wrap" if wrap else None,
+            css_class,
+        ]
+        flex_class = " ".join([cls for cls in classes if cls])
         
         super().__init__("div", css_class=flex_class, id_attr=id_attr)
         
         if isinstance(content, list):
-            self.content = ""
-            for item in content:
-                if hasattr(item, 'render'):
-                    self.content += item.render()
-                else:
-                    self.content += str(item)
+            self.add_many(content)
         else:
             self.content = str(content)
 
-    def add_item(self, item):
-        """Add an item to the flex container"""
-        if hasattr(item, 'render'):
-            self.content += item.render()
-        else:
-            self.content += str(item)
-        return self
\ No newline at end of file
+    def add_item(self, *items):
+        """Add one or more items to the flex container"""
+        return self.add_many(items)
\ No newline at end of file
@@ -1,263 +1,43 @@
 from .css import CSSBuilder
+from .elements import escape_html
 from typing import List, Dict, Any, Optional
-import tempfile
-import webbrowser
+import copy
 import os
 
-class Page:
-    def __init__(self, title: str, header_text: str, logo_url: Optional[str] = None, 
-                 nav_links: Optional[List[Dict[str, Any]]] = None, header_class: Optional[str] = None,
-                 css_framework: str = "bootstrap", custom_css: Optional[str] = None,
-                 use_modern_navbar: bool = True):
-        self.title = title
-        self.header_text = header_text
-        self.logo_url = logo_url
-        self.nav_links = nav_links if nav_links is not None else []
-        self.header_class = header_class
-        self.body_content = []
-        self.css_framework = css_framework
-        self.custom_css = custom_css
-        self.meta_tags = {}
-        self.scripts = []
-        self.css_links = []
-        self.body_classes = []
-        self.container_class = "container"
-        self.use_modern_navbar = use_modern_navbar
-        self.navbar_config = {
-            'brand': {'name': 'NexusLabs', 'icon': '🌟'},
-            'style': 'modern',
-            'dropdown_support': True,
-            'mobile_responsive': True
-        }
-        
-        # Template manager
-        self.template_manager = None
-        
-        # Set default CSS framework
-        if css_framework == "bootstrap":
-            self.add_css_link("https://cdn.replit.com/agent/bootstrap-agent-dark-theme.min.css")
-            self.add_script("https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js")
-
-    def add_meta_tag(self, name: str, content: str):
-        """Add a meta tag to the page"""
-        self.meta_tags[name] = content
-        return self
-
-    def add_css_link(self, href: str):
-        """Add a CSS link to the page"""
-        self.css_links.append(href)
-        return self
-
-    def add_script(self, src: str):
-        """Add a JavaScript script to the page"""
-        self.scripts.append(src)
-        return self
-
-    def add_body_class(self, class_name: str):
-        """Add a class to the body element"""
-        self.body_classes.append(class_name)
-        return self
-
-    def set_container_class(self, class_name: str):
-        """Set the container class for the main content"""
-        self.container_class = class_name
-        return self
-
-    def add_navbar(self, nav_links: List[Dict[str, Any]]):
-        """Add navigation links to the page"""
-        self.nav_links.extend(nav_links)
-        return self
-    
-    def configure_navbar(self, brand_name: Optional[str] = None, brand_icon: Optional[str] = None, 
-                        style: str = 'modern', dropdown_support: bool = True,
-                        mobile_responsive: bool = True):
-        """Configure the modern navigation bar"""
-        self.navbar_config.update({
-            'brand': {'name': brand_name if brand_name is not None else self.navbar_config['brand']['name'],
-                     'icon': brand_icon if brand_icon is not None else self.navbar_config['brand']['icon']},
-            'style': style,
-            'dropdown_support': dropdown_support,
-            'mobile_responsive': mobile_responsive
-        })
-        return self
-
-    def set_theme(self, theme: str):
-        """Set a predefined theme for the page"""
-        # Clear existing CSS links that are theme-related
-        self.css_links = [link for link in self.css_links if 'bootstrap' not in link.lower()]
-        
-        if theme == "bootstrap":
-            self.add_css_link("https://cdn.replit.com/agent/bootstrap-agent-dark-theme.min.css")
-        elif theme == "bootstrap-light":
-            self.add_css_link("https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css")
-        elif theme == "tailwind":
-            self.add_css_link("https://cdn.tailwindcss.com")
-        elif theme == "bulma":
-            self.add_css_link("https://cdn.jsdelivr.net/npm/bulma@0.9.4/css/bulma.min.css")
-        elif theme == "material":
-            self.add_css_link("https://fonts.googleapis.com/icon?family=Material+Icons")
-            self.add_css_link("https://cdnjs.cloudflare.com/ajax/libs/materialize/1.0.0/css/materialize.min.css")
-            self.add_script("https://cdnjs.cloudflare.com/ajax/libs/materialize/1.0.0/js/materialize.min.js")
-        
-        return self
-
-    def use_template_manager(self, template_manager):
-        """Set the template manager for this page"""
-        self.template_manager = template_manager
-        return self
-
-    def use_template(self, template_name: str, slot_map: Optional[Dict[str, str]] = None):
-        """Use a template with slot content"""
-        if self.template_manager:
-            template_content = self.template_manager.render_template(template_name, slot_map)
-            self.add_content(template_content)
-        return self
-
-    def add_content(self, content):
-        """Add content to the body of the page"""
-        if hasattr(content, 'render'):
-            self.body_content.append(content.render())
-        else:
-            self.body_content.append(str(content))
-        return self
-
-    def add_element(self, element):
-        """Add an HTML element to the page"""
-        return self.add_content(element)
-
-    def render_meta_tags(self):
-        """Render meta tags"""
-        meta_html = ""
-        for name, content in self.meta_tags.items():
-            meta_html += f'    <meta name="{name}" content="{content}">\n'
-        return meta_html
-
-    def render_css_links(self):
-        """Render CSS links"""
-        css_html = ""
-        for href in self.css_links:
-            css_html += f'    <link rel="stylesheet" href="{href}">\n'
-        return css_html
-
-    def render_scripts(self):
-        """Render JavaScript scripts"""
-        script_html = ""
-        for src in self.scripts:
-            script_html += f'    <script src="{src}"></script>\n'
-        return script_html
-
-    def render_header(self):
-        """Render the header section of the page"""
-        logo_html = f'<img src="{self.logo_url}" alt="Logo" class="logo me-3" style="height: 40px;">' if self.logo_url else ""
-        header_class_attr = f' class="{self.header_class}"' if self.header_class else ' class="bg-dark text-light py-3"'
-        
-        header_html = f"""
-        <header{header_class_attr}>
-            <div class="container">
-                <div class="d-flex align-items-center justify-content-between">
-                    <div class="d-flex align-items-center">
-                        {logo_html}
-                        <h1 class="h3 mb-0">{self.header_text}</h1>
-                    </div>
-                    {self.render_navbar()}
-                </div>
-            </div>
-        </header>
-        """
-        return header_html
-
-    def render_navbar(self):
-        """Render the modern navigation bar"""
-        if not self.nav_links and not self.use_modern_navbar:
-            return ""
-        
-        if self.use_modern_navbar:
-            return self.render_modern_navbar()
-        else:
-            return self.render_basic_navbar()
-    
-    def render_basic_navbar(self):
-        """Render the basic navigation bar"""
-        nav_items = ""
-        for link in self.nav_links:
-            if isinstance(link, dict):
-                nav_items += f'<li class="nav-item"><a class="nav-link text-light" href="{link.get("url", "#")}">{link.get("text", "Link")}</a></li>'
-            else:
-                nav_items += f'<li class="nav-item"><a class="nav-link text-light" href="{link}">{link}</a></li>'
-        
-        return f"""
-        <nav class="navbar-nav">
-            <ul class="nav">
-                {nav_items}
-            </ul>
-        </nav>
-        """
-    
-    def render_modern_navbar(self):
-        """Render the modern navigation bar with enhanced styling"""
-        brand = self.navbar_config['brand']
-        nav_items = ""
-        
-        for link in self.nav_links:
-            if isinstance(link, dict):
-                if 'dropdown' in link:
-                    # Dropdown menu
-                    dropdown_items = ""
-                    for dropdown_item in link['dropdown']:
-                        dropdown_items += f'''
-                        <li class="dropdown-item">
-                            <a href="{dropdown_item.get('url', '#')}" class="dropdown-link">{dropdown_item.get('text', 'Item')}</a>
-                        </li>'''
-                    
-                    nav_items += f'''
-                    <li class="nav-item">
-                        <a href="{link.get('url', '#')}" class="nav-link">
-                            {link.get('text', 'Link')}
-                            <i>▼</i>
-                        </a>
-                        <ul class="dropdown-menu">
-                            {dropdown_items}
-                        </ul>
-                    </li>'''
-                else:
-                    # Regular link
-                    nav_items += f'''
-                    <li class="nav-item">
-                        <a href="{link.get('url', '#')}" class="nav-link">{link.get('text', 'Link')}</a>
-                    </li>'''
-            else:
-                nav_items += f'''
-                <li class="nav-item">
-                    <a href="#" class="nav-link">{link}</a>
-                </li>'''
-        
-        return f'''
-        <nav class="navbar">
-            <div class="nav-container">
-                <a href="#" class="logo">
-                    <span class="logo-icon">{brand['icon']}</span>
-                    <span>{brand['name']}</span>
-                </a>
-
-                <button class="hamburger">
-                    <span></span>
-                    <span></span>
-                    <span></span>
-                    <span></span>
-                </button>
-
-                <ul class="nav-links">
-                    {nav_items}
-                    <li class="nav-item">
-                        <button class="nav-btn">Get Started</button>
-                    </li>
-                </ul>
-            </div>
-        </nav>'''
+# Default assets for css_framework="bootstrap"
+_BOOTSTRAP_DARK_CSS = "https://cdn.replit.com/agent/bootstrap-agent-dark-theme.min.css"
+_BOOTSTRAP_JS = "https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"
+
+# CSS links and scripts added by each set_theme() choice
+_THEME_ASSETS = {
+    "bootstrap": ((_BOOTSTRAP_DARK_CSS,), ()),
+    "bootstrap-light": (("https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css",), ()),
+    "tailwind": (("https://cdn.tailwindcss.com",), ()),
+    "bulma": (("https://cdn.jsdelivr.net/npm/bulma@0.9.4/css/bulma.min.css",), ()),
+    "material": (
+        ("https://fonts.googleapis.com/icon?family=Material+Icons",
+         "https://cdnjs.cloudflare.com/ajax/libs/materialize/1.0.0/css/materialize.min.css"),
+        ("https://cdnjs.cloudflare.com/ajax/libs/materialize/1.0.0/js/materialize.min.js",),
+    ),
+}
+
+# Fixed pieces of the document skeleton around the per-page parts
+_DOCUMENT_START = """<!DOCTYPE html>
+<html lang="en" data-bs-theme="dark">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+_TITLE_END = "</title>\n"
+_MAIN_END = """
+    </main>
+"""
+_DOCUMENT_END = """
+</body>
+</html>"""
 
-    def get_modern_navbar_css(self):
-        """Get CSS for the modern navigation bar"""
-        return '''
+# Static assets of the modern navbar, built once per process
+_MODERN_NAVBAR_CSS = '''
         * {
             margin: 0;
             padding: 0;
@@ -541,9 +321,7 @@ class Page:
         }
         '''
 
-    def get_modern_navbar_js(self):
-        """Get JavaScript for the modern navigation bar"""
-        return '''
+_MODERN_NAVBAR_JS = '''
         // Mobile menu toggle and scroll effect
         const navbar = document.querySelector('.navbar');
         const hamburger = document.querySelector('.hamburger');
@@ -620,57 +398,418 @@ class Page:
         });
         '''
 
+# Ready-made tags for the common case of a modern navbar without extra styles
+_MODERN_NAVBAR_STYLE_TAG = f"<style>\n{_MODERN_NAVBAR_CSS}\n    </style>"
+_MODERN_NAVBAR_SCRIPT_TAG = f"<script>\n{_MODERN_NAVBAR_JS}\n    </script>"
+
+class Page:
+    # Known fields use slots; __dict__ keeps user flags such as page.debug_mode = True working
+    __slots__ = ('title', 'header_text', 'logo_url', 'nav_links', 'header_class', 'body_content',
+                 'css_framework', 'custom_css', 'custom_js', 'meta_tags', 'scripts', 'css_links', 'body_classes',
+                 'container_class', 'use_modern_navbar', 'navbar_config', 'template_manager',
+                 '_html_cache', '_styles_version', '_bytes_cache', '__dict__')
+    
+    def __init__(self, title: str, header_text: str, logo_url: Optional[str] = None, 
+                 nav_links: Optional[List[Dict[str, Any]]] = None, header_class: Optional[str] = None,
+                 css_framework: str = "bootstrap", custom_css: Optional[str] = None,
+                 use_modern_navbar: bool = True):
+        self.title = title
+        self.header_text = header_text
+        self.logo_url = logo_url
+        self.nav_links = nav_links if nav_links is not None else []
+        self.header_class = header_class
+        self.body_content = []
+        self.css_framework = css_framework
+        self.custom_css = custom_css
+        self.custom_js = None
+        self.meta_tags = {}
+        self.scripts = []
+        self.css_links = []
+        self.body_classes = []
+        self.container_class = "container"
+        self.use_modern_navbar = use_modern_navbar
+        self.navbar_config = {
+            'brand': {'name': 'NexusLabs', 'icon': '🌟'},
+            'style': 'modern',
+            'dropdown_support': True,
+            'mobile_responsive': True
+        }
+        
+        # Template manager
+        self.template_manager = None
+        
+        # Document frozen by compile(), reused until the page or its manager's styles change
+        self._html_cache = None
+        self._styles_version = 0
+        
+        # Encoded document as (source html, bytes), valid while that html is current
+        self._bytes_cache = (None, b"")
+        
+        # Set default CSS framework
+        if css_framework == "bootstrap":
+            self.add_css_link(_BOOTSTRAP_DARK_CSS)
+            self.add_script(_BOOTSTRAP_JS)
+
+    def add_meta_tag(self, name: str, content: str):
+        """Add a meta tag to the page"""
+        self._html_cache = None
+        self.meta_tags[name] = content
+        return self
+
+    def add_css_link(self, href: str):
+        """Add a CSS link to the page"""
+        self._html_cache = None
+        self.css_links.append(href)
+        return self
+
+    def add_script(self, src: str):
+        """Add a JavaScript script to the page"""
+        self._html_cache = None
+        self.scripts.append(src)
+        return self
+
+    def add_body_class(self, class_name: str):
+        """Add a class to the body element"""
+        self._html_cache = None
+        self.body_classes.append(class_name)
+        return self
+
+    def set_container_class(self, class_name: str):
+        """Set the container class for the main content"""
+        self._html_cache = None
+        self.container_class = class_name
+        return self
+
+    def add_navbar(self, nav_links: List[Dict[str, Any]]):
+        """Add navigation links to the page"""
+        self._html_cache = None
+        self.nav_links.extend(nav_links)
+        return self
+    
+    def configure_navbar(self, brand_name: Optional[str] = None, brand_icon: Optional[str] = None, 
+                        style: str = 'modern', dropdown_support: bool = True,
+                        mobile_responsive: bool = True):
+        """Configure the modern navigation bar"""
+        self._html_cache = None
+        self.navbar_config.update({
+            'brand': {'name': brand_name if brand_name is not None else self.navbar_config['brand']['name'],
+                     'icon': brand_icon if brand_icon is not None else self.navbar_config['brand']['icon']},
+            'style': style,
+            'dropdown_support': dropdown_support,
+            'mobile_responsive': mobile_responsive
+        })
+        return self
+
+    def set_theme(self, theme: str):
+        """Set a predefined theme for the page"""
+        self._html_cache = None
+        # Clear existing CSS links that are theme-related
+        self.css_links = [link for link in self.css_links if 'bootstrap' not in link.lower()]
+        
+        css_links, scripts = _THEME_ASSETS.get(theme, ((), ()))
+        self.css_links.extend(css_links)
+        self.scripts.extend(scripts)
+        
+        return self
+
+    def use_template_manager(self, template_manager):
+        """Set the template manager for this page"""
+        self.template_manager = template_manager
+        return self
+
+    def use_template(self, template_name: str, slot_map: Optional[Dict[str, str]] = None):
+        """Use a template with slot content"""
+        if self.template_manager:
+            template_content = self.template_manager.render_template(template_name, slot_map)
+            self.add_content(template_content)
+        return self
+
+    def add_content(self, content):
+        """Add content to the body of the page; elements are rendered when the page is generated"""
+        self._html_cache = None
+        self.body_content.append(content if hasattr(content, 'render') else str(content))
+        return self
+
+    def add_element(self, element):
+        """Add an HTML element to the page"""
+        return self.add_content(element)
+
+    def render_meta_tags(self):
+        """Render meta tags"""
+        if not self.meta_tags:
+            return ""
+        return "".join([
+            f'    <meta name="{name}" content="{content}">\n'
+            for name, content in self.meta_tags.items()
+        ])
+
+    def render_css_links(self):
+        """Render CSS links"""
+        if not self.css_links:
+            return ""
+        return "".join([f'    <link rel="stylesheet" href="{href}">\n' for href in self.css_links])
+
+    def render_scripts(self):
+        """Render JavaScript scripts"""
+        if not self.scripts:
+            return ""
+        return "".join([f'    <script src="{src}"></script>\n' for src in self.scripts])
+
+    def render_header(self):
+        """Render the header section of the page"""
+        esc = escape_html
+        logo_html = f'<img src="{esc(self.logo_url)}" alt="Logo" class="logo me-3" style="height: 40px;">' if self.logo_url else ""
+        header_class_attr = f' class="{esc(self.header_class)}"' if self.header_class else ' class="bg-dark text-light py-3"'
+        
+        header_html = f"""
+        <header{header_class_attr}>
+            <div class="container">
+                <div class="d-flex align-items-center justify-content-between">
+                    <div class="d-flex align-items-center">
+                        {logo_html}
+                        <h1 class="h3 mb-0">{esc(self.header_text)}</h1>
+                    </div>
+                    {self.render_navbar()}
+                </div>
+            </div>
+        </header>
+        """
+        return header_html
+
+    def render_navbar(self):
+        """Render the modern navigation bar"""
+        if not self.nav_links and not self.use_modern_navbar:
+            return ""
+        
+        if self.use_modern_navbar:
+            return self.render_modern_navbar()
+        else:
+            return self.render_basic_navbar()
+    
+    def render_basic_navbar(self):
+        """Render the basic navigation bar"""
+        esc = escape_html
+        nav_items = "".join([
+            f'<li class="nav-item"><a class="nav-link text-light" href="{esc(link.get("url", "#"))}">{esc(link.get("text", "Link"))}</a></li>'
+            if isinstance(link, dict) else
+            f'<li class="nav-item"><a class="nav-link text-light" href="{esc(link)}">{esc(link)}</a></li>'
+            for link in self.nav_links
+        ])
+        
+        return f"""
+        <nav class="navbar-nav">
+            <ul class="nav">
+                {nav_items}
+            </ul>
+        </nav>
+        """
+    
+    def render_modern_navbar(self):
+        """Render the modern navigation bar with enhanced styling"""
+        esc = escape_html
+        brand = self.navbar_config['brand']
+        nav_items = []
+        append = nav_items.append
+        
+        for link in self.nav_links:
+            if isinstance(link, dict):
+                if 'dropdown' in link:
+                    # Dropdown menu
+                    dropdown_items = "".join([f'''
+                        <li class="dropdown-item">
+                            <a href="{esc(dropdown_item.get('url', '#'))}" class="dropdown-link">{esc(dropdown_item.get('text', 'Item'))}</a>
+                        </li>''' for dropdown_item in link['dropdown']])
+                    
+                    append(f'''
+                    <li class="nav-item">
+                        <a href="{esc(link.get('url', '#'))}" class="nav-link">
+                            {esc(link.get('text', 'Link'))}
+                            <i>▼</i>
+                        </a>
+                        <ul class="dropdown-menu">
+                            {dropdown_items}
+                        </ul>
+                    </li>''')
+                else:
+                    # Regular link
+                    append(f'''
+                    <li class="nav-item">
+                        <a href="{esc(link.get('url', '#'))}" class="nav-link">{esc(link.get('text', 'Link'))}</a>
+                    </li>''')
+            else:
+                append(f'''
+                <li class="nav-item">
+                    <a href="#" class="nav-link">{esc(link)}</a>
+                </li>''')
+        nav_items = "".join(nav_items)
+        
+        return f'''
+        <nav class="navbar">
+            <div class="nav-container">
+                <a href="#" class="logo">
+                    <span class="logo-icon">{brand['icon']}</span>
+                    <span>{esc(brand['name'])}</span>
+                </a>
+
+                <button class="hamburger">
+                    <span></span>
+                    <span></span>
+                    <span></span>
+                    <span></span>
+                </button>
+
+                <ul class="nav-links">
+                    {nav_items}
+                    <li class="nav-item">
+                        <button class="nav-btn">Get Started</button>
+                    </li>
+                </ul>
+            </div>
+        </nav>'''
+
+    def get_modern_navbar_css(self):
+        """Get CSS for the modern navigation bar"""
+        return _MODERN_NAVBAR_CSS
+
+    def get_modern_navbar_js(self):
+        """Get JavaScript for the modern navigation bar"""
+        return _MODERN_NAVBAR_JS
+
+    def __setattr__(self, name, value):
+        # Assigning any public attribute invalidates the cached document
+        if not name.startswith('_'):
+            object.__setattr__(self, '_html_cache', None)
+        object.__setattr__(self, name, value)
+
+    def clone(self):
+        """Return an independent deep copy of the page without a JSON round trip"""
+        return copy.deepcopy(self)
+
+    def compile(self):
+        """Render the page now so later generate_html calls reuse the result"""
+        self._html_cache = "".join(self._html_parts())
+        self._styles_version = self._current_styles_version()
+        return self
+
+    def _current_styles_version(self):
+        """Version of the template manager's global styles, or 0 without a manager"""
+        manager = self.template_manager
+        return manager.styles_version if manager else 0
+
+    def _compiled_html(self):
+        """The document frozen by compile(), or None if there is none or it is stale"""
+        html = self._html_cache
+        if html is not None and self._styles_version == self._current_styles_version():
+            return html
+        return None
+
     def generate_html(self):
         """Generate the complete HTML for the page"""
+        # Only an explicit compile() freezes the output; otherwise in-place edits must show up
+        html = self._compiled_html()
+        if html is None:
+            html = "".join(self._html_parts())
+        return html
+
+    def render_bytes(self) -> bytes:
+        """Return the page as UTF-8 bytes, ready to use as an HTTP response body"""
+        html = self.generate_html()
+        source, data = self._bytes_cache
+        if source is not html:
+            data = html.encode('utf-8')
+            self._bytes_cache = (html, data)
+        return data
+
+    def iter_html(self):
+        """Yield the page HTML fragment by fragment"""
+        html = self._compiled_html()
+        if html is not None:
+            yield html
+        else:
+            yield from self._html_parts()
+
+    def write_html(self, fp):
+        """Write the page HTML to a text file object fragment by fragment"""
+        fp.writelines(self.iter_html())
+        return self
+
+    def generate_static_html(self):
+        """Generate the page without scripts, for PDF export and snapshots"""
+        return "".join(self._html_parts(interactive=False))
+
+    def _html_parts(self, interactive: bool = True):
+        """Build the list of HTML fragments that make up the page"""
         body_class_attr = f' class="{" ".join(self.body_classes)}"' if self.body_classes else ""
-        body = "\n".join(self.body_content)
         
         # Combine custom CSS with modern navbar CSS if needed
-        all_css = ""
+        css_parts = []
         if self.use_modern_navbar:
-            all_css += self.get_modern_navbar_css()
+            css_parts.append(self.get_modern_navbar_css())
+        if self.template_manager and self.template_manager.global_styles:
+            css_parts.append("\n" + self.template_manager.render_global_styles())
         if self.custom_css:
-            all_css += "\n" + self.custom_css
-        
-        custom_css_tag = f"<style>\n{all_css}\n    </style>" if all_css else ""
+            css_parts.append("\n" + self.custom_css)
+        if len(css_parts) == 1 and css_parts[0] is _MODERN_NAVBAR_CSS:
+            # Navbar styles only: the tag is prebuilt
+            custom_css_tag = _MODERN_NAVBAR_STYLE_TAG
+        else:
+            all_css = "".join(css_parts)
+            custom_css_tag = f"<style>\n{all_css}\n    </style>" if all_css else ""
         
         # Add modern navbar JavaScript if needed
         navbar_js = ""
-        if self.use_modern_navbar:
-            navbar_js = f"<script>\n{self.get_modern_navbar_js()}\n    </script>"
+        if interactive and self.use_modern_navbar:
+            navbar_js_code = self.get_modern_navbar_js()
+            if navbar_js_code is _MODERN_NAVBAR_JS:
+                navbar_js = _MODERN_NAVBAR_SCRIPT_TAG
+            else:
+                navbar_js = f"<script>\n{navbar_js_code}\n    </script>"
         
-        html = f"""<!DOCTYPE html>
-<html lang="en" data-bs-theme="dark">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.title}</title>
-{self.render_meta_tags()}{self.render_css_links()}    {custom_css_tag}
+        parts = [
+            _DOCUMENT_START, escape_html(self.title), _TITLE_END,
+            self.render_meta_tags(),
+            self.render_css_links(),
+            "    ", custom_css_tag, f"""
 </head>
 <body{body_class_attr}>
-    {self.render_header()}
+    """,
+            self.render_header(),
+            f"""
     <main class="{self.container_class} mt-4">
-        {body}
-    </main>
-{self.render_scripts()}    {navbar_js}
-</body>
-</html>"""
-        return html
+        """,
+        ]
+        
+        # Body elements write their fragments straight into parts, one line apart
+        append = parts.append
+        for index, item in enumerate(self.body_content):
+            if index:
+                append("\n")
+            if isinstance(item, str):
+                append(item)
+            elif hasattr(item, 'render_to'):
+                item.render_to(parts)
+            else:
+                append(item.render())
+        
+        parts.extend((_MAIN_END, self.render_scripts() if interactive else "", "    ", navbar_js, _DOCUMENT_END))
+        return parts
 
     def save_to_file(self, filename: str):
-        """Save the generated HTML to a file"""
-        with open(filename, 'w', encoding='utf-8') as file:
-            file.write(self.generate_html())
+        """Save the generated HTML to a file as UTF-8"""
+        # Binary mode skips the text layer; a compiled page also reuses its encoded bytes
+        with open(filename, 'wb') as file:
+            file.write(self.render_bytes())
         return self
     
     def run(self, port: int = 8000, auto_open: bool = True):
         """Run the webpage directly in the browser (development mode)"""
-        html_content = self.generate_html()
+        import tempfile
+        import webbrowser
         
         # Create a temporary file
         temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.html', 
                                               delete=False, encoding='utf-8')
-        temp_file.write(html_content)
+        self.write_html(temp_file)
         temp_file.close()
         
         if auto_open:
@@ -703,6 +842,10 @@ class Page:
         return self
 
 class Heading:
+    """Heading element (h1-h6)"""
+    
+    __slots__ = ('text', 'level', 'css_class', 'id_attr')
+    
     def __init__(self, text: str, level: int = 1, css_class: Optional[str] = None, 
                  id_attr: Optional[str] = None):
         self.text = text
@@ -715,10 +858,10 @@ class Heading:
         if not (1 <= self.level <= 6):
             raise ValueError("Heading level must be between 1 and 6.")
         
-        class_attr = f' class="{self.css_class}"' if self.css_class else ""
-        id_attr = f' id="{self.id_attr}"' if self.id_attr else ""
+        class_attr = f' class="{escape_html(self.css_class)}"' if self.css_class else ""
+        id_attr = f' id="{escape_html(self.id_attr)}"' if self.id_attr else ""
         
-        return f"<h{self.level}{class_attr}{id_attr}>{self.text}</h{self.level}>"
+        return f"<h{self.level}{class_attr}{id_attr}>{escape_html(self.text)}</h{self.level}>"
 
     def set_class(self, css_class: str):
         """Set CSS class for the heading"""
@@ -1,9 +1,9 @@
 """
 Plugin system for extending HTML generator components
 """
-from typing import Dict, Any, Callable, Optional, Type, List
+from typing import Dict, Any, Callable, Optional, Type, List, NamedTuple, Union
 from .elements import Element
-from .components import ComponentBase
+from .components import ComponentBase, _as_record
 
 class PluginRegistry:
     """Registry for managing custom components and plugins"""
@@ -107,23 +107,29 @@ def register_filter(name: Optional[str] = None):
         return func
     return decorator
 
+class TimelineEvent(NamedTuple):
+    """A single event shown in a Timeline"""
+    title: str = ''
+    date: str = ''
+    description: str = ''
+
 # Example plugin components
 @register_component("Timeline")
 class Timeline(ComponentBase):
     """Timeline component for displaying chronological events"""
     
-    def __init__(self, events: List[Dict[str, str]], orientation: str = "vertical", 
+    def __init__(self, events: List[Union[TimelineEvent, Dict[str, str]]], orientation: str = "vertical", 
                  css_class: Optional[str] = None):
         timeline_class = f"timeline timeline-{orientation}"
         if css_class:
             timeline_class += f" {css_class}"
         
         super().__init__(css_class=timeline_class)
-        self.events = events
+        self.events = events = tuple(_as_record(TimelineEvent, event) for event in events)
         self.orientation = orientation
         
         # Build timeline HTML
-        timeline_html = ""
+        parts = []
         for i, event in enumerate(events):
             item_class = "timeline-item"
             if i % 2 == 0 and orientation == "vertical":
@@ -131,18 +137,18 @@ class Timeline(ComponentBase):
             else:
                 item_class += " timeline-item-right"
             
-            timeline_html += f"""
+            parts.append(f"""
             <div class="{item_class}">
                 <div class="timeline-marker"></div>
                 <div class="timeline-content">
-                    <h5 class="timeline-title">{event.get('title', '')}</h5>
-                    <p class="timeline-date">{event.get('date', '')}</p>
-                    <p class="timeline-description">{event.get('description', '')}</p>
+                    <h5 class="timeline-title">{event.title}</h5>
+                    <p class="timeline-date">{event.date}</p>
+                    <p class="timeline-description">{event.description}</p>
                 </div>
             </div>
-            """
+            """)
         
-        self.content = timeline_html
+        self.content = ''.join(parts)
     
     def render(self):
         attrs = self.render_attributes()
@@ -239,14 +245,26 @@ class Timeline(ComponentBase):
         
         return f"{timeline_css}<{self.tag}{attrs}>{self.content}</{self.tag}>"
 
+_STAT_CARD_HTML = """
+        <div class="card-body text-center">
+            {icon}
+            <h3 class="stat-value">{value}</h3>
+            <p class="stat-label">{label}</p>
+            {delta}
+        </div>
+        """
+
 @register_component("StatCard")
 class StatCard(ComponentBase):
     """Statistics card component for dashboards"""
     
     def __init__(self, label: str, value: str, icon: str = "", 
                  delta: str = "", delta_type: str = "neutral", 
-                 css_class: Optional[str] = None):
+                 css_class: Optional[str] = None, grid_width: Optional[Union[str, int]] = None):
         card_class = "stat-card card"
+        if grid_width is not None:
+            # Act as the grid column itself instead of needing a Column wrapper
+            card_class += f" col-{grid_width}"
         if css_class:
             card_class += f" {css_class}"
         
@@ -260,16 +278,12 @@ class StatCard(ComponentBase):
         elif delta_type == "negative":
             delta_symbol = "↘"
         
-        card_html = f"""
-        <div class="card-body text-center">
-            {f'<i class="{icon} stat-icon"></i>' if icon else ''}
-            <h3 class="stat-value">{value}</h3>
-            <p class="stat-label">{label}</p>
-            {f'<small class="{delta_class}">{delta_symbol} {delta}</small>' if delta else ''}
-        </div>
-        """
-        
-        self.content = card_html
+        self.content = _STAT_CARD_HTML.format(
+            icon=f'<i class="{icon} stat-icon"></i>' if icon else '',
+            value=value,
+            label=label,
+            delta=f'<small class="{delta_class}">{delta_symbol} {delta}</small>' if delta else '',
+        )
     
     def render(self):
         attrs = self.render_attributes()
@@ -1,6 +1,20 @@
+import re
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from .elements import Element
 
+@lru_cache(maxsize=128)
+def _split_slots(content: str, slot_names: tuple) -> tuple:
+    """Split template content into static chunks and slot names, shared by equal templates"""
+    if not slot_names:
+        return (content,)
+    pattern = "|".join(re.escape(f"{{{{ {slot_name} }}}}") for slot_name in slot_names)
+    pieces = re.split(f"({pattern})", content)
+    # Odd positions hold matched placeholders; keep only the slot name
+    for i in range(1, len(pieces), 2):
+        pieces[i] = pieces[i][3:-3]
+    return tuple(pieces)
+
 class Template:
     """Template class for reusable HTML blocks"""
     
@@ -14,20 +28,23 @@ class Template:
         self.slots[slot_name] = default_content
         return self
     
+    def compile(self):
+        """Split the template into static chunks and slot names"""
+        return _split_slots(self.content, tuple(self.slots))
+    
     def render(self, slot_map: Optional[Dict[str, str]] = None):
         """Render the template with slot content"""
         if slot_map is None:
             slot_map = {}
-            
-        rendered_content = self.content
+        
+        parts = list(self.compile())
         
         # Replace slots with provided content or defaults
-        for slot_name, default_content in self.slots.items():
-            slot_placeholder = f"{{{{ {slot_name} }}}}"
-            slot_content = slot_map.get(slot_name, default_content)
-            rendered_content = rendered_content.replace(slot_placeholder, slot_content)
+        for i in range(1, len(parts), 2):
+            slot_name = parts[i]
+            parts[i] = slot_map.get(slot_name, self.slots[slot_name])
         
-        return rendered_content
+        return "".join(parts)
 
 class Slot(Element):
     """Slot element for template placeholders"""
@@ -47,12 +64,25 @@ class TemplateManager:
     
     def __init__(self):
         self.templates = {}
+        self.global_styles = {}
+        # Bumped on every style registration so pages know their cached HTML is stale
+        self.styles_version = 0
     
     def register_template(self, template: Template):
         """Register a template"""
         self.templates[template.name] = template
         return self
     
+    def register_global_style(self, name: str, css: str):
+        """Register a stylesheet emitted in the head of every page using this manager"""
+        self.global_styles[name] = css
+        self.styles_version += 1
+        return self
+    
+    def render_global_styles(self) -> str:
+        """Render all registered global styles as one CSS string"""
+        return "\n".join(self.global_styles.values())
+    
     def get_template(self, name: str) -> Optional[Template]:
         """Get a template by name"""
         return self.templates.get(name)
@@ -65,9 +95,7 @@ class TemplateManager:
         return f"<!-- Template '{name}' not found -->"
 
 # Common template definitions
-def create_hero_template():
-    """Create a hero section template"""
-    hero_template = Template("hero", """
+_HERO_TEMPLATE = """
     <div class="hero-section bg-primary text-white text-center py-5">
         <div class="container">
             <h1 class="display-4">{{ title }}</h1>
@@ -77,15 +105,9 @@ def create_hero_template():
             </div>
         </div>
     </div>
-    """)
-    hero_template.define_slot("title", "Welcome")
-    hero_template.define_slot("subtitle", "Your amazing website")
-    hero_template.define_slot("actions", "")
-    return hero_template
+    """
 
-def create_card_grid_template():
-    """Create a card grid template"""
-    card_grid_template = Template("card_grid", """
+_CARD_GRID_TEMPLATE = """
     <div class="container my-5">
         <div class="row">
             <div class="col-12 text-center mb-4">
@@ -97,15 +119,9 @@ def create_card_grid_template():
             {{ cards }}
         </div>
     </div>
-    """)
-    card_grid_template.define_slot("section_title", "Features")
-    card_grid_template.define_slot("section_subtitle", "Discover what we offer")
-    card_grid_template.define_slot("cards", "")
-    return card_grid_template
+    """
 
-def create_footer_template():
-    """Create a footer template"""
-    footer_template = Template("footer", """
+_FOOTER_TEMPLATE = """
     <footer class="bg-dark text-white py-4 mt-5">
         <div class="container">
             <div class="row">
@@ -124,7 +140,27 @@ def create_footer_template():
             </div>
         </div>
     </footer>
-    """)
+    """
+
+def create_hero_template():
+    """Create a hero section template"""
+    hero_template = Template("hero", _HERO_TEMPLATE)
+    hero_template.define_slot("title", "Welcome")
+    hero_template.define_slot("subtitle", "Your amazing website")
+    hero_template.define_slot("actions", "")
+    return hero_template
+
+def create_card_grid_template():
+    """Create a card grid template"""
+    card_grid_template = Template("card_grid", _CARD_GRID_TEMPLATE)
+    card_grid_template.define_slot("section_title", "Features")
+    card_grid_template.define_slot("section_subtitle", "Discover what we offer")
+    card_grid_template.define_slot("cards", "")
+    return card_grid_template
+
+def create_footer_template():
+    """Create a footer template"""
+    footer_template = Template("footer", _FOOTER_TEMPLATE)
     footer_template.define_slot("company_name", "Your Company")
     footer_template.define_slot("company_description", "Building amazing web experiences.")
     footer_template.define_slot("links", "")
@@ -11,6 +11,8 @@ import json
 class InteractiveChart(ComponentBase):
     """Interactive chart component using Chart.js"""
     
+    __slots__ = ('chart_type', 'data', 'options', 'canvas_id')
+    
     def __init__(self, chart_type='bar', data=None, options=None, canvas_id=None, **kwargs):
         super().__init__(**kwargs)
         self.chart_type = chart_type
@@ -35,34 +37,55 @@ class InteractiveChart(ComponentBase):
 <script>
 document.addEventListener('DOMContentLoaded', function() {{
     const ctx = document.getElementById('{self.canvas_id}').getContext('2d');
-    new Chart(ctx, {json.dumps(chart_config)});
+    new Chart(ctx, JSON.parse({json.dumps(json.dumps(chart_config))}));
 }});
 </script>'''
 
 
+def _to_plain(value):
+    """Convert numpy arrays and scalars to plain Python lists and numbers"""
+    return value.tolist() if hasattr(value, 'tolist') else value
+
+
+def _plain_label(label):
+    """Return a JSON-serializable chart label, stringifying dates and the like"""
+    label = _to_plain(label)
+    return label if isinstance(label, (str, int, float)) else str(label)
+
+
 class DataVisualization(ComponentBase):
     """Advanced data visualization with multiple chart types"""
     
+    __slots__ = ('data', 'chart_type', 'title', '_chart_id', '_title_block',
+                 '_labels', '_values')
+    
     def __init__(self, data, chart_type='line', title='', **kwargs):
         super().__init__(**kwargs)
+        # Coerce numpy arrays/scalars and other non-JSON values once here so
+        # render can serialize the stored lists directly
+        data = _to_plain(data)
         self.data = data
         self.chart_type = chart_type
         self.title = title
-        
-    def render(self):
-        chart_id = f"viz_{id(self)}"
+        self._chart_id = f"viz_{id(self)}"
+        self._title_block = f'<h3 class="mb-3">{title}</h3>' if title else ''
         
         # Prepare data for different chart types
-        if isinstance(self.data, list) and len(self.data) > 0:
-            if isinstance(self.data[0], dict):
-                labels = [item.get('label', str(i)) for i, item in enumerate(self.data)]
-                values = [item.get('value', 0) for item in self.data]
+        if isinstance(data, list) and len(data) > 0:
+            if isinstance(data[0], dict):
+                self._labels = [_plain_label(item.get('label', str(i))) for i, item in enumerate(data)]
+                self._values = [_to_plain(item.get('value', 0)) for item in data]
             else:
-                labels = [str(i) for i in range(len(self.data))]
-                values = self.data
+                self._labels = [str(i) for i in range(len(data))]
+                self._values = [_to_plain(value) for value in data]
         else:
-            labels = []
-            values = []
+            self._labels = []
+            self._values = []
+        
+    def render(self):
+        chart_id = self._chart_id
+        labels = self._labels
+        values = self._values
             
         chart_data = {
             'labels': labels,
@@ -88,9 +111,25 @@ class DataVisualization(ComponentBase):
                 'borderWidth': 1
             }]
         }
+        chart_config = {
+            'type': self.chart_type,
+            'data': chart_data,
+            'options': {
+                'responsive': True,
+                'maintainAspectRatio': False,
+                'plugins': {
+                    'legend': {
+                        'position': 'top'
+                    },
+                    'title': {
+                        'display': False
+                    }
+                }
+            }
+        }
         
         return f'''<div class="data-visualization {self.css_class}" style="{self.style}">
-    {f'<h3 class="mb-3">{self.title}</h3>' if self.title else ''}
+    {self._title_block}
     <div style="position: relative; height: 400px;">
         <canvas id="{chart_id}"></canvas>
     </div>
@@ -98,34 +137,80 @@ class DataVisualization(ComponentBase):
 <script>
 document.addEventListener('DOMContentLoaded', function() {{
     const ctx = document.getElementById('{chart_id}').getContext('2d');
-    new Chart(ctx, {{
-        type: '{self.chart_type}',
-        data: {json.dumps(chart_data)},
-        options: {{
-            responsive: true,
-            maintainAspectRatio: false,
-            plugins: {{
-                legend: {{
-                    position: 'top',
-                }},
-                title: {{
-                    display: false
-                }}
-            }}
-        }}
-    }});
+    // Parsed with JSON.parse, which browsers handle faster than an object literal
+    new Chart(ctx, JSON.parse({json.dumps(json.dumps(chart_config))}));
 }});
 </script>'''
 
 
+def _option_value_text(opt):
+    """Split a choice option into its value and display text"""
+    if isinstance(opt, dict):
+        value = opt.get('value', '')
+        return value, opt.get('text', value)
+    value = str(opt)
+    return value, value
+
+
+def _field_template(control):
+    """Wrap a control snippet in the shared field wrapper, label and feedback"""
+    return (
+        '<div class="mb-3 form-field" data-field="{name}">{label_html}'
+        + control
+        + '<div class="invalid-feedback" id="{name}_feedback"></div></div>'
+    )
+
+
+_INPUT_FIELD_TEMPLATE = _field_template(
+    '<input type="{type}" class="{css_class}" id="{name}" name="{name}" {required}>'
+)
+
+# Field type -> format template, filled from the context built by
+# AdvancedFormBuilder._build_ctx; unknown types render as text inputs
+_FIELD_TEMPLATES = {
+    'text': _INPUT_FIELD_TEMPLATE,
+    'email': _INPUT_FIELD_TEMPLATE,
+    'password': _INPUT_FIELD_TEMPLATE,
+    'date': _INPUT_FIELD_TEMPLATE,
+    'textarea': _field_template(
+        '<textarea class="{css_class}" id="{name}" name="{name}" rows="{rows}" {required}></textarea>'
+    ),
+    'select': _field_template(
+        '<select class="{css_class}" id="{name}" name="{name}" {required}>{options_html}</select>'
+    ),
+    'checkbox': _field_template(
+        '<div class="form-check"><input class="form-check-input" type="checkbox" id="{name}" name="{name}">'
+        '<label class="form-check-label" for="{name}">{label}</label></div>'
+    ),
+    'radio': _field_template('<div class="form-check-group">{options_html}</div>'),
+    'file': _field_template(
+        '<input type="file" class="{css_class}" id="{name}" name="{name}" accept="{accept}" {required}>'
+    ),
+    'number': _field_template(
+        '<input type="number" class="{css_class}" id="{name}" name="{name}" '
+        'min="{min}" max="{max}" step="{step}" {required}>'
+    ),
+}
+
+_RADIO_OPTION_TEMPLATE = '''
+                <div class="form-check">
+                    <input class="form-check-input" type="radio" name="{name}" id="{radio_id}" value="{value}" {required}>
+                    <label class="form-check-label" for="{radio_id}">{text}</label>
+                </div>'''
+
+
 class AdvancedFormBuilder(ComponentBase):
     """Advanced form builder with validation and modern inputs"""
     
+    __slots__ = ('form_id', 'fields', 'validation_rules', '_manifest_json_parts')
+    
     def __init__(self, form_id=None, **kwargs):
         super().__init__(**kwargs)
         self.form_id = form_id or f"form_{id(self)}"
         self.fields = []
         self.validation_rules = {}
+        # Pre-serialized `"name": {...}` entries of the client-side field manifest
+        self._manifest_json_parts = []
         
     def add_field(self, field_type, name, label='', options=None, validation=None):
         """Add a field to the form"""
@@ -139,103 +224,79 @@ class AdvancedFormBuilder(ComponentBase):
         self.fields.append(field)
         if validation:
             self.validation_rules[name] = validation
+        self._manifest_json_parts.append(
+            f'{json.dumps(name)}:{json.dumps({"type": field_type, "rules": validation or None})}'
+        )
         return self
         
-    def render_field(self, field):
-        """Render individual form field"""
+    def _build_ctx(self, field):
+        """Precompute the template context for a single field"""
         field_type = field['type']
         name = field['name']
         label = field['label']
         options = field['options']
-        validation = field['validation']
+        required = 'required' if field['validation'].get('required') else ''
         
-        # Common attributes
-        required = 'required' if validation.get('required') else ''
-        css_class = f"form-control {options.get('css_class', '')}"
-        
-        # Field wrapper
-        wrapper_start = f'<div class="mb-3 form-field" data-field="{name}">'
-        label_html = f'<label for="{name}" class="form-label">{label}</label>' if label else ''
-        wrapper_end = '</div>'
+        ctx = {
+            'type': field_type if field_type in _FIELD_TEMPLATES else 'text',
+            'name': name,
+            'label': label,
+            # The checkbox template carries its own label
+            'label_html': f'<label for="{name}" class="form-label">{label}</label>' if label and field_type != 'checkbox' else '',
+            'css_class': f"form-control {options.get('css_class', '')}",
+            'required': required,
+        }
         
-        # Generate field based on type
-        if field_type == 'text':
-            field_html = f'<input type="text" class="{css_class}" id="{name}" name="{name}" {required}>'
-        elif field_type == 'email':
-            field_html = f'<input type="email" class="{css_class}" id="{name}" name="{name}" {required}>'
-        elif field_type == 'password':
-            field_html = f'<input type="password" class="{css_class}" id="{name}" name="{name}" {required}>'
-        elif field_type == 'textarea':
-            rows = options.get('rows', 3)
-            field_html = f'<textarea class="{css_class}" id="{name}" name="{name}" rows="{rows}" {required}></textarea>'
+        if field_type == 'textarea':
+            ctx['rows'] = options.get('rows', 3)
         elif field_type == 'select':
-            select_options = options.get('options', [])
-            options_html = ''
-            for opt in select_options:
-                if isinstance(opt, dict):
-                    value = opt.get('value', '')
-                    text = opt.get('text', value)
-                else:
-                    value = text = str(opt)
-                options_html += f'<option value="{value}">{text}</option>'
-            field_html = f'<select class="{css_class}" id="{name}" name="{name}" {required}>{options_html}</select>'
-        elif field_type == 'checkbox':
-            field_html = f'<div class="form-check"><input class="form-check-input" type="checkbox" id="{name}" name="{name}"><label class="form-check-label" for="{name}">{label}</label></div>'
-            label_html = ''  # Label is part of checkbox
+            ctx['options_html'] = ''.join(
+                f'<option value="{value}">{text}</option>'
+                for value, text in map(_option_value_text, options.get('options', []))
+            )
         elif field_type == 'radio':
-            radio_options = options.get('options', [])
-            field_html = '<div class="form-check-group">'
-            for i, opt in enumerate(radio_options):
-                if isinstance(opt, dict):
-                    value = opt.get('value', '')
-                    text = opt.get('text', value)
-                else:
-                    value = text = str(opt)
-                radio_id = f"{name}_{i}"
-                field_html += f'''
-                <div class="form-check">
-                    <input class="form-check-input" type="radio" name="{name}" id="{radio_id}" value="{value}" {required}>
-                    <label class="form-check-label" for="{radio_id}">{text}</label>
-                </div>'''
-            field_html += '</div>'
+            ctx['options_html'] = ''.join(
+                _RADIO_OPTION_TEMPLATE.format(name=name, radio_id=f"{name}_{i}", value=value,
+                                              text=text, required=required)
+                for i, (value, text) in enumerate(map(_option_value_text, options.get('options', [])))
+            )
         elif field_type == 'file':
-            accept = options.get('accept', '')
-            field_html = f'<input type="file" class="{css_class}" id="{name}" name="{name}" accept="{accept}" {required}>'
-        elif field_type == 'date':
-            field_html = f'<input type="date" class="{css_class}" id="{name}" name="{name}" {required}>'
+            ctx['accept'] = options.get('accept', '')
         elif field_type == 'number':
-            min_val = options.get('min', '')
-            max_val = options.get('max', '')
-            step = options.get('step', '')
-            field_html = f'<input type="number" class="{css_class}" id="{name}" name="{name}" min="{min_val}" max="{max_val}" step="{step}" {required}>'
-        else:
-            field_html = f'<input type="text" class="{css_class}" id="{name}" name="{name}" {required}>'
-            
-        # Add validation feedback
-        feedback_html = f'<div class="invalid-feedback" id="{name}_feedback"></div>'
+            ctx['min'] = options.get('min', '')
+            ctx['max'] = options.get('max', '')
+            ctx['step'] = options.get('step', '')
         
-        return wrapper_start + label_html + field_html + feedback_html + wrapper_end
+        return ctx
+        
+    def render_field(self, field):
+        """Render individual form field"""
+        ctx = self._build_ctx(field)
+        return _FIELD_TEMPLATES[ctx['type']].format_map(ctx)
         
     def render(self):
         """Render the complete form"""
-        fields_html = ''.join([self.render_field(field) for field in self.fields])
+        ctxs = [self._build_ctx(field) for field in self.fields]
+        fields_html = ''.join(_FIELD_TEMPLATES[ctx['type']].format_map(ctx) for ctx in ctxs)
+        field_manifest = '{' + ','.join(self._manifest_json_parts) + '}'
         
         validation_js = f'''
 <script>
 document.addEventListener('DOMContentLoaded', function() {{
     const form = document.getElementById('{self.form_id}');
-    const validationRules = {json.dumps(self.validation_rules)};
+    const fieldManifest = {field_manifest};
     
     // Add real-time validation
     form.addEventListener('input', function(e) {{
-        validateField(e.target, validationRules[e.target.name]);
+        const entry = fieldManifest[e.target.name];
+        validateField(e.target, entry && entry.rules);
     }});
     
     form.addEventListener('submit', function(e) {{
         let isValid = true;
-        Object.keys(validationRules).forEach(fieldName => {{
+        Object.keys(fieldManifest).forEach(fieldName => {{
             const field = form.querySelector(`[name="${{fieldName}}"]`);
-            if (field && !validateField(field, validationRules[fieldName])) {{
+            if (field && !validateField(field, fieldManifest[fieldName].rules)) {{
                 isValid = false;
             }}
         }});
@@ -315,17 +376,20 @@ document.addEventListener('DOMContentLoaded', function() {{
 class MicroInteraction(ComponentBase):
     """Micro-interactions and animations component"""
     
+    __slots__ = ('element', 'interaction_type', 'animation', '_interaction_id',
+                 '_animation_css', '_interaction_js')
+    
     def __init__(self, element, interaction_type='hover', animation='pulse', **kwargs):
         super().__init__(**kwargs)
         self.element = element
         self.interaction_type = interaction_type
         self.animation = animation
         
-    def render(self):
         interaction_id = f"interaction_{id(self)}"
+        self._interaction_id = interaction_id
         
         # Animation CSS
-        animation_css = f'''
+        self._animation_css = f'''
 <style>
 .micro-interaction-{interaction_id} {{
     transition: all 0.3s ease;
@@ -369,49 +433,127 @@ class MicroInteraction(ComponentBase):
 </style>'''
 
         # JavaScript for interactions
-        interaction_js = f'''
+        self._interaction_js = f'''
 <script>
 document.addEventListener('DOMContentLoaded', function() {{
     const element = document.getElementById('{interaction_id}');
     
-    if ('{self.interaction_type}' === 'hover') {{
+    if ('{interaction_type}' === 'hover') {{
         element.addEventListener('mouseenter', function() {{
-            this.classList.add('{self.animation}');
+            this.classList.add('{animation}');
         }});
         
         element.addEventListener('mouseleave', function() {{
-            this.classList.remove('{self.animation}');
+            this.classList.remove('{animation}');
         }});
-    }} else if ('{self.interaction_type}' === 'click') {{
+    }} else if ('{interaction_type}' === 'click') {{
         element.addEventListener('click', function() {{
-            this.classList.add('{self.animation}');
+            this.classList.add('{animation}');
             setTimeout(() => {{
-                this.classList.remove('{self.animation}');
+                this.classList.remove('{animation}');
             }}, 600);
         }});
     }}
 }});
 </script>'''
-
+        
+    def render(self):
+        interaction_id = self._interaction_id
         element_html = self.element.render() if hasattr(self.element, 'render') else str(self.element)
         
-        return f'''{animation_css}
+        return f'''{self._animation_css}
 <div id="{interaction_id}" class="micro-interaction-{interaction_id} {self.css_class}" style="{self.style}">
     {element_html}
 </div>
-{interaction_js}'''
+{self._interaction_js}'''
+
+
+_A11Y_CHECKER_JS = '''<script>
+if (!window.A11yChecker) {
+    const A11Y_CHECKS = [
+        { name: 'Alt Text for Images', status: 'pass', description: 'All images have appropriate alt text' },
+        { name: 'Color Contrast', status: 'warning', description: 'Some text may not meet WCAG contrast ratios' },
+        { name: 'Keyboard Navigation', status: 'pass', description: 'All interactive elements are keyboard accessible' },
+        { name: 'Semantic HTML', status: 'pass', description: 'Proper heading structure and semantic elements used' },
+        { name: 'Focus Indicators', status: 'fail', description: 'Some elements lack visible focus indicators' },
+        { name: 'ARIA Labels', status: 'pass', description: 'Interactive elements have appropriate ARIA labels' }
+    ];
+
+    window.A11yChecker = class {
+        constructor(id) {
+            this.id = id;
+            this.scoreElement = document.getElementById(id + '-score');
+            this.progressElement = document.getElementById(id + '-progress');
+            this.resultsElement = document.getElementById(id + '-results');
+            document.getElementById(id + '-run').addEventListener('click', () => this.runCheck());
+        }
+
+        runCheck() {
+            this.scoreElement.textContent = 'Checking...';
+            this.scoreElement.className = 'badge bg-warning';
+            this.progressElement.style.width = '0%';
+
+            // Simulate checking process
+            let progress = 0;
+            const interval = setInterval(() => {
+                progress += 10;
+                this.progressElement.style.width = progress + '%';
+
+                if (progress >= 100) {
+                    clearInterval(interval);
+                    this.displayResults();
+                }
+            }, 200);
+        }
+
+        displayResults() {
+            const passCount = A11Y_CHECKS.filter(c => c.status === 'pass').length;
+            const score = Math.round((passCount / A11Y_CHECKS.length) * 100);
+
+            this.scoreElement.textContent = score + '%';
+            this.scoreElement.className = score >= 80 ? 'badge bg-success' : score >= 60 ? 'badge bg-warning' : 'badge bg-danger';
+
+            this.resultsElement.innerHTML = A11Y_CHECKS.map((check, index) => {
+                const statusIcon = check.status === 'pass' ? 'check-circle text-success' :
+                                  check.status === 'warning' ? 'exclamation-triangle text-warning' :
+                                  'times-circle text-danger';
+                const collapseId = this.id + '-collapse' + index;
+
+                return `
+                <div class="accordion-item">
+                    <h2 class="accordion-header">
+                        <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#${collapseId}">
+                            <i class="fas fa-${statusIcon} me-2"></i>
+                            ${check.name}
+                        </button>
+                    </h2>
+                    <div id="${collapseId}" class="accordion-collapse collapse">
+                        <div class="accordion-body">
+                            ${check.description}
+                        </div>
+                    </div>
+                </div>`;
+            }).join('');
+        }
+    };
+}
+</script>
+'''
 
 
 class AccessibilityChecker(ComponentBase):
     """Accessibility compliance checker component"""
     
+    __slots__ = ('_checker_id',)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._checker_id = f"a11y_checker_{id(self)}"
         
     def render(self):
-        checker_id = f"a11y_checker_{id(self)}"
+        checker_id = self._checker_id
         
-        return f'''<div id="{checker_id}" class="accessibility-checker {self.css_class}" style="{self.style}">
+        return f'''{_A11Y_CHECKER_JS}<div id="{checker_id}" class="accessibility-checker {self.css_class}" style="{self.style}">
     <div class="card">
         <div class="card-header">
             <h5 class="mb-0">
@@ -422,86 +564,21 @@ class AccessibilityChecker(ComponentBase):
         <div class="card-body">
             <div class="d-flex justify-content-between align-items-center mb-3">
                 <span>Accessibility Score</span>
-                <div id="a11y-score" class="badge bg-secondary">Checking...</div>
+                <div id="{checker_id}-score" class="badge bg-secondary">Checking...</div>
             </div>
             
             <div class="progress mb-3">
-                <div id="a11y-progress" class="progress-bar" role="progressbar" style="width: 0%"></div>
+                <div id="{checker_id}-progress" class="progress-bar" role="progressbar" style="width: 0%"></div>
             </div>
             
-            <div id="a11y-results" class="accordion">
+            <div id="{checker_id}-results" class="accordion">
                 <!-- Results will be populated here -->
             </div>
             
-            <button type="button" class="btn btn-primary" onclick="runA11yCheck()">
+            <button type="button" class="btn btn-primary" id="{checker_id}-run">
                 <i class="fas fa-search me-2"></i>Run Accessibility Check
             </button>
         </div>
     </div>
 </div>
-
-<script>
-function runA11yCheck() {{
-    const scoreElement = document.getElementById('a11y-score');
-    const progressElement = document.getElementById('a11y-progress');
-    const resultsElement = document.getElementById('a11y-results');
-    
-    scoreElement.textContent = 'Checking...';
-    scoreElement.className = 'badge bg-warning';
-    progressElement.style.width = '0%';
-    
-    // Simulate checking process
-    let progress = 0;
-    const interval = setInterval(() => {{
-        progress += 10;
-        progressElement.style.width = progress + '%';
-        
-        if (progress >= 100) {{
-            clearInterval(interval);
-            displayA11yResults();
-        }}
-    }}, 200);
-}}
-
-function displayA11yResults() {{
-    const scoreElement = document.getElementById('a11y-score');
-    const resultsElement = document.getElementById('a11y-results');
-    
-    // Mock accessibility checks
-    const checks = [
-        {{ name: 'Alt Text for Images', status: 'pass', description: 'All images have appropriate alt text' }},
-        {{ name: 'Color Contrast', status: 'warning', description: 'Some text may not meet WCAG contrast ratios' }},
-        {{ name: 'Keyboard Navigation', status: 'pass', description: 'All interactive elements are keyboard accessible' }},
-        {{ name: 'Semantic HTML', status: 'pass', description: 'Proper heading structure and semantic elements used' }},
-        {{ name: 'Focus Indicators', status: 'fail', description: 'Some elements lack visible focus indicators' }},
-        {{ name: 'ARIA Labels', status: 'pass', description: 'Interactive elements have appropriate ARIA labels' }}
-    ];
-    
-    const passCount = checks.filter(c => c.status === 'pass').length;
-    const score = Math.round((passCount / checks.length) * 100);
-    
-    scoreElement.textContent = score + '%';
-    scoreElement.className = score >= 80 ? 'badge bg-success' : score >= 60 ? 'badge bg-warning' : 'badge bg-danger';
-    
-    resultsElement.innerHTML = checks.map((check, index) => {{
-        const statusIcon = check.status === 'pass' ? 'check-circle text-success' : 
-                          check.status === 'warning' ? 'exclamation-triangle text-warning' : 
-                          'times-circle text-danger';
-        
-        return `
-        <div class="accordion-item">
-            <h2 class="accordion-header">
-                <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#collapse${{index}}">
-                    <i class="fas fa-${{statusIcon}} me-2"></i>
-                    ${{check.name}}
-                </button>
-            </h2>
-            <div id="collapse${{index}}" class="accordion-collapse collapse">
-                <div class="accordion-body">
-                    ${{check.description}}
-                </div>
-            </div>
-        </div>`;
-    }}).join('');
-}}
-</script>'''
\ No newline at end of file
+<script>new A11yChecker('{checker_id}');</script>'''